@@ -17,3 +17,5 @@ OUTPUT_JSON_FILE = "brown_county_parcels_test.json"
 SCRAPER_BASE_URL = "https://prod-landrecords.browncountywi.gov"
 SCRAPER_HEADLESS = True  # Set to False to see browser actions
 SCRAPER_SELENIUM_TIMEOUT = 30  # Timeout in seconds for Selenium operations
+SCRAPER_MAX_WORKERS = 1  # Parcels scraped concurrently (each worker opens its own browser when needed)
+SCRAPER_PARCELS_PER_SECOND = 0.5  # Maximum parcels started per second across all workers
@@ -2,7 +2,6 @@
 Helper functions for Brown County Scraper tests
 """
 
-import json
 from typing import List, Dict, Any
 
 
@@ -47,8 +46,7 @@ def save_results_to_files(results: List[Dict[str, Any]], scraper, csv_filename:
     scraper.save_to_excel(results, excel_filename)
     
     # Save raw JSON for debugging
-    with open(json_filename, 'w') as f:
-        json.dump(results, f, indent=2, default=str)
+    scraper.save_to_json(results, json_filename)
     print(f"Raw data saved to {json_filename}")
 
 
@@ -6,9 +6,16 @@ Creates separate tables for properties, tax periods, installments, and delinquen
 """
 
 import pandas as pd
+import openpyxl
+import csv
+import os
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
 from typing import List, Dict, Optional, Any
-from datetime import datetime
+from datetime import date, datetime
+from decimal import Decimal
 import re
+from scraper_utils import atomic_output
 
 
 class TaxDataNormalizer:
@@ -31,6 +38,15 @@ class TaxDataNormalizer:
         Returns:
             Dictionary of DataFrames, one for each table
         """
+        # Timestamp stamped on every row of this normalization run, formatted once per run
+        self.extraction_date = datetime.now().isoformat()
+        # Each call normalizes only the results it is given; rows from earlier calls are not rebuilt
+        self.properties = []
+        self.tax_periods = []
+        self.installments = []
+        self.delinquent_taxes = []
+        self.penalties_interest = []
+        
         for result in scraped_results:
             parcel_id = result.get('parcel_id')
             search_data = result.get('search_data', {})
@@ -72,7 +88,7 @@ class TaxDataNormalizer:
             'owner_name': None,
             'municipality': None,
             'address': None,
-            'extraction_date': datetime.now().isoformat(),
+            'extraction_date': self.extraction_date,
             'source': 'lacrosse_county'
         }
         
@@ -160,7 +176,7 @@ class TaxDataNormalizer:
                             'tax_year': year,
                             'total_tax_amount': self._extract_amount(year_data, ['total', 'amount', 'totalTax', 'total_tax']),
                             'status': self._determine_status(year_data),
-                            'extraction_date': datetime.now().isoformat()
+                            'extraction_date': self.extraction_date
                         }
                         periods.append(period)
         
@@ -203,7 +219,7 @@ class TaxDataNormalizer:
                                 'paid_date': self._extract_date(inst, ['paidDate', 'paid_date', 'paid']),
                                 'status': self._determine_installment_status(inst),
                                 'tax_year': inst_year,
-                                'extraction_date': datetime.now().isoformat()
+                                'extraction_date': self.extraction_date
                             }
                             installments.append(installment)
                             installment_num += 1
@@ -232,7 +248,7 @@ class TaxDataNormalizer:
                             'paid_date': self._extract_date(inst, ['paidDate', 'paid_date', 'paid']),
                             'status': self._determine_installment_status(inst),
                             'tax_year': self._extract_year_from_data(inst),
-                            'extraction_date': datetime.now().isoformat()
+                            'extraction_date': self.extraction_date
                         }
                         installments.append(installment)
                         installment_num += 1
@@ -280,7 +296,7 @@ class TaxDataNormalizer:
                             'delinquent_amount': delinquent_amount,
                             'status': 'delinquent',
                             'installments_delinquent': self._extract_delinquent_installments(unpaid),
-                            'extraction_date': datetime.now().isoformat()
+                            'extraction_date': self.extraction_date
                         }
                         delinquent.append(delinquent_record)
             
@@ -321,7 +337,7 @@ class TaxDataNormalizer:
                             'delinquent_amount': year_data['total_delinquent'],
                             'status': 'delinquent',
                             'installments_delinquent': ', '.join([str(i.get('installment_number', '')) for i in year_data['installments']]),
-                            'extraction_date': datetime.now().isoformat()
+                            'extraction_date': self.extraction_date
                         }
                         delinquent.append(delinquent_record)
         
@@ -359,7 +375,7 @@ class TaxDataNormalizer:
                     'penalty_amount': penalty_amount or 0.0,
                     'interest_amount': interest_amount or 0.0,
                     'total_penalties_interest': (penalty_amount or 0.0) + (interest_amount or 0.0),
-                    'extraction_date': datetime.now().isoformat()
+                    'extraction_date': self.extraction_date
                 }
                 penalties.append(penalty_record)
         
@@ -543,7 +559,7 @@ class TaxDataNormalizer:
                     'paid_date': None,
                     'status': status,
                     'tax_year': tax_year,
-                    'extraction_date': datetime.now().isoformat()
+                    'extraction_date': self.extraction_date
                 }
                 installments.append(installment)
         
@@ -619,16 +635,58 @@ class TaxDataNormalizer:
             ])
         return pd.DataFrame(self.penalties_interest)
     
+    @staticmethod
+    def _iter_rows(df: pd.DataFrame):
+        """Rows of a DataFrame as plain tuples, with missing values (NaN/None/NaT) as None"""
+        return df.astype(object).where(df.notna(), None).itertuples(index=False, name=None)
+    
+    @staticmethod
+    def _format_datetimes(df: pd.DataFrame) -> pd.DataFrame:
+        """Datetime columns as the strings to_csv writes (date-only when every time is midnight)"""
+        datetime_columns = [column for column, dtype in df.dtypes.items()
+                            if pd.api.types.is_datetime64_any_dtype(dtype)]
+        if not datetime_columns:
+            return df
+        df = df.copy()
+        for column in datetime_columns:
+            df[column] = df[column].astype(str).where(df[column].notna(), None)
+        return df
+    
     def save_to_csv_files(self, dataframes: Dict[str, pd.DataFrame], base_filename: str):
         """Save all DataFrames to separate CSV files"""
         for table_name, df in dataframes.items():
             filename = f"{base_filename}_{table_name}.csv"
-            df.to_csv(filename, index=False)
+            # csv.writer over row tuples skips pandas' per-column formatter; output matches to_csv(index=False)
+            with atomic_output(filename) as tmp_filename:
+                with open(tmp_filename, 'w', newline='', encoding='utf-8') as f:
+                    writer = csv.writer(f, lineterminator=os.linesep)
+                    writer.writerow(df.columns)
+                    writer.writerows(self._iter_rows(self._format_datetimes(df)))
             print(f"✓ Saved {table_name} to {filename} ({len(df)} rows)")
     
     def save_to_excel_sheets(self, dataframes: Dict[str, pd.DataFrame], filename: str):
         """Save all DataFrames to separate sheets in an Excel file"""
-        with pd.ExcelWriter(filename, engine='openpyxl') as writer:
-            for table_name, df in dataframes.items():
-                df.to_excel(writer, sheet_name=table_name, index=False)
+        # Write-only workbook: rows are streamed to the sheet XML instead of kept as a cell model
+        wb = openpyxl.Workbook(write_only=True)
+        header_font = Font(bold=True)
+        for table_name, df in dataframes.items():
+            ws = wb.create_sheet(title=table_name)
+            
+            # Only the header row is styled
+            header = []
+            for column in df.columns:
+                cell = WriteOnlyCell(ws, value=str(column))
+                cell.font = header_font
+                header.append(cell)
+            ws.append(header)
+            
+            # Missing values become empty cells and nested values (lists/dicts) their string form,
+            # as with DataFrame.to_excel; dates and numbers stay native cell values
+            for row in self._iter_rows(df):
+                ws.append([
+                    value if value is None or isinstance(value, (str, int, float, bool, Decimal, date)) else str(value)
+                    for value in row
+                ])
+        with atomic_output(filename) as tmp_filename:
+            wb.save(tmp_filename)
         print(f"✓ Saved all tables to {filename}")
@@ -25,6 +25,8 @@ from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import Select
 import json
+from concurrent.futures import ThreadPoolExecutor
+from scraper_utils import mount_pooled_adapter, write_json
 
 
 class LaCrosseScraper:
@@ -38,7 +40,8 @@ class LaCrosseScraper:
             base_url: Base URL for the website
         """
         self.base_url = base_url
-        self.session = requests.Session()
+        self.session = mount_pooled_adapter(requests.Session())
+        
         self.cookies = {}
         self.driver = None
         
@@ -857,8 +860,12 @@ class LaCrosseScraper:
         results = []
         
         try:
-            # Step 1: Get cookies
-            self.get_cookies()
+            # Step 1: Get cookies. The first request pays DNS/TLS setup and the browser launch takes
+            # seconds; neither needs the other, so Chrome starts while the cookies are fetched
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                browser_ready = executor.submit(self.setup_selenium)
+                self.get_cookies()
+                browser_ready.result()
             
             # Step 2: Guest login via Selenium
             self.guest_login_selenium()
@@ -1073,6 +1080,12 @@ class LaCrosseScraper:
             self.driver.quit()
             self.driver = None
             print("\n✓ Selenium driver closed")
+        # Release pooled connections; the session reconnects if used again
+        self.session.close()
+    
+    def save_to_json(self, data: List[Dict], filename: str, pretty: bool = False):
+        """Save raw scraped data as a JSON array, compact unless pretty (dates as ISO strings, Decimals as numbers)"""
+        write_json(data, filename, pretty)
     
     def save_to_csv(self, data: List[Dict], filename: str):
         """Save scraped data to CSV file"""
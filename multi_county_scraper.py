@@ -10,9 +10,36 @@ from data_normalizer import TaxDataNormalizer
 from lacrosse_scraper import LaCrosseScraper
 import pandas as pd
 import json
+import csv
+import io
 from datetime import datetime
 
 
+def postgres_copy(table, conn, keys, data_iter):
+    """
+    pandas ``to_sql`` insertion method that uses PostgreSQL COPY (psycopg2 connections only)
+
+    Args:
+        table: pandas SQLTable being written
+        conn: SQLAlchemy connection
+        keys: Column names
+        data_iter: Iterable of row tuples
+    """
+    # Write the rows to an in-memory CSV buffer and stream it through COPY
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerows(data_iter)
+    buffer.seek(0)
+    
+    columns = ', '.join(f'"{key}"' for key in keys)
+    table_name = f'"{table.schema}"."{table.name}"' if table.schema else f'"{table.name}"'
+    sql = f"COPY {table_name} ({columns}) FROM STDIN WITH CSV"
+    
+    dbapi_conn = conn.connection
+    with dbapi_conn.cursor() as cursor:
+        cursor.copy_expert(sql=sql, file=buffer)
+
+
 class MultiCountyScraper:
     """Framework for scraping multiple counties"""
     
@@ -107,15 +134,23 @@ class MultiCountyScraper:
         
         return combined_data
     
-    def save_normalized_data(self, data: Dict[str, pd.DataFrame], output_dir: str = ".", prefix: str = "tax_data"):
+    def save_normalized_data(self, data: Dict[str, pd.DataFrame], output_dir: str = ".", prefix: str = "tax_data",
+                             sink: str = "files", engine=None):
         """
-        Save normalized data to CSV files and Excel
+        Save normalized data to CSV files and Excel, or directly to a database
         
         Args:
             data: Dictionary of DataFrames
             output_dir: Directory to save files
             prefix: Prefix for filenames
+            sink: 'files' for CSV/Excel output, 'sql' to write tables through engine
+            engine: SQLAlchemy engine (required when sink='sql')
         """
+        if sink == 'sql':
+            return self._save_to_sql(data, engine)
+        if sink != 'files':
+            raise ValueError(f"Unknown sink '{sink}'. Available: ['files', 'sql']")
+        
         import os
         
         # Create output directory if it doesn't exist
@@ -138,7 +173,39 @@ class MultiCountyScraper:
             'csv_files': [os.path.join(output_dir, f"{prefix}_{name}.csv") for name in data.keys()],
             'excel_file': excel_path
         }
-
+    
+    def _save_to_sql(self, data: Dict[str, pd.DataFrame], engine) -> Dict:
+        """
+        Append normalized tables to a database, skipping the CSV/Excel round-trip
+        
+        Args:
+            data: Dictionary of DataFrames
+            engine: SQLAlchemy engine
+            
+        Returns:
+            Dictionary of table name to rows written
+        """
+        if engine is None:
+            raise ValueError("An SQLAlchemy engine is required when sink='sql'")
+        
+        # PostgreSQL over psycopg2 gets COPY (copy_expert is psycopg2-only); everything else uses multi-row INSERTs
+        use_copy = engine.dialect.name == 'postgresql' and engine.dialect.driver == 'psycopg2'
+        method = postgres_copy if use_copy else 'multi'
+        
+        rows_written = {}
+        for table_name, df in data.items():
+            # Counties with no data for a table yield a column-less DataFrame, which can't become a table
+            if len(df.columns) == 0:
+                print(f"- Skipped {table_name} (no columns)")
+                continue
+            # Multi-row INSERTs bind one parameter per cell, so size batches to stay within the lowest
+            # common bind limit (999, older SQLite builds; SQL Server allows 2100)
+            chunksize = 10_000 if use_copy else max(1, 999 // len(df.columns))
+            df.to_sql(table_name, engine, method=method, chunksize=chunksize, if_exists='append', index=False)
+            rows_written[table_name] = len(df)
+            print(f"✓ Saved {table_name} to database table {table_name} ({len(df)} rows)")
+        
+        return {'sql_tables': rows_written}
 
 def main():
     """Example usage"""
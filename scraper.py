@@ -7,20 +7,150 @@ This module contains scrapers for:
 """
 
 import requests
-from bs4 import BeautifulSoup
-import pandas as pd
-from typing import List, Dict, Optional, Any
+import openpyxl
+from typing import List, Dict, Optional, Any, Iterator
+from dataclasses import dataclass
+from contextlib import contextmanager
+from functools import lru_cache
+import sys
+import os
 import time
 import re
-import xml.etree.ElementTree as ET
+import io
+import csv
+import json
+import logging
+import threading
+import queue
+from urllib.parse import urlencode
+from concurrent.futures import ThreadPoolExecutor
+from lxml import etree
+import lxml.html
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.action_chains import ActionChains
+from scraper_utils import atomic_output, mount_pooled_adapter, write_json
+
+try:
+    import requests_cache
+except ImportError:  # Optional: Website1 API responses are then fetched uncached
+    requests_cache = None
+
+
+logger = logging.getLogger(__name__)
+
+
+# Shared XML parser for API responses (tolerates oversized text nodes; malformed markup is an error,
+# so server error pages are reported with a response preview)
+_XML_PARSER = etree.XMLParser(huge_tree=True)
+
+# Shared HTML parser for token extraction from server responses and browser page sources
+_HTML_PARSER = lxml.html.HTMLParser()
+
+# Namespace and precompiled XPath for parcel items in RealEstateTaxParcelService responses
+PARCEL_NS = {'rs': 'http://schemas.datacontract.org/2004/07/LRS.Providers.ServiceViewModels.PropertyListing.RealEstateTaxParcel'}
+PARCEL_XPATH = etree.XPath('.//rs:RealEstateTaxParcelVm', namespaces=PARCEL_NS)
+
+# Leaf elements with non-blank text, used to flatten responses that lack parcel items
+# (the string value covers every text node, so text after a comment still counts)
+TEXT_LEAVES_XPATH = etree.XPath('descendant-or-self::*[not(*) and normalize-space()]')
+
+
+def _parse_xml(content: bytes):
+    """
+    Parse an XML API response body
+    
+    Args:
+        content: Raw response bytes
+        
+    Returns:
+        Root element of the parsed document
+        
+    Raises:
+        etree.XMLSyntaxError: If the body is not well-formed XML, or is an HTML page
+    """
+    root = etree.fromstring(content, _XML_PARSER)
+    # A well-formed HTML error page would otherwise be flattened into "No ParcelId found"
+    if _localname(root.tag).lower() == 'html':
+        raise etree.XMLSyntaxError('HTML page instead of XML', 0, 1, 1)
+    return root
+
+
+@lru_cache(maxsize=1024)
+def _localname(tag: str) -> str:
+    """Strip the '{namespace}' prefix from an element tag (few distinct tags, so cached)"""
+    return tag.rpartition('}')[2] or tag
+
+
+def _is_json_response(response: requests.Response) -> bool:
+    """Whether the server declared a JSON body (e.g. application/json)"""
+    return 'json' in response.headers.get('Content-Type', '').lower()
+
+
+class RateLimiter:
+    """Thread-safe limiter that spaces calls evenly at a fixed rate"""
+    
+    def __init__(self, rate: float):
+        """
+        Initialize the limiter
+        
+        Args:
+            rate: Maximum calls per second (0 disables limiting)
+        """
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_time = 0.0
+    
+    def wait(self):
+        """Block until the caller may make its next call"""
+        with self._lock:
+            now = time.monotonic()
+            wait_time = self._next_time - now
+            self._next_time = max(now, self._next_time) + self.interval
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+
+# Slotted dataclasses need Python 3.10+; older interpreters fall back to a regular __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
+class ParcelResult:
+    """Outcome of scraping one Website1 parcel, with a fixed set of fields"""
+    
+    parcel_number: str
+    # None (not []/{}) when a step never ran, so error rows leave these CSV/Excel cells empty
+    search_data: Any = None
+    tax_data: Any = None
+    error: Optional[str] = None
+    response_preview: Optional[str] = None
+    tax_response_preview: Optional[str] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Flatten to a row for the CSV/Excel/JSON writers
+        
+        Returns:
+            Dictionary with the same columns for every parcel
+        """
+        return {
+            'ParcelNumber': self.parcel_number,
+            'SearchData': self.search_data,
+            'TaxBillData': self.tax_data,
+            'Error': self.error,
+            'ResponsePreview': self.response_preview,
+            'TaxResponsePreview': self.tax_response_preview,
+        }
+    
+    @classmethod
+    def fieldnames(cls) -> List[str]:
+        """Column names produced by to_dict, in order"""
+        return list(cls('').to_dict())
 
 
 class BaseScraper:
@@ -34,7 +164,8 @@ class BaseScraper:
             base_url: Base URL for the website
         """
         self.base_url = base_url
-        self.session = requests.Session()
+        self.session = mount_pooled_adapter(self._create_session())
+        
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/143.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
@@ -45,6 +176,10 @@ class BaseScraper:
         }
         self.session.headers.update(self.headers)
     
+    def _create_session(self) -> requests.Session:
+        """Create the HTTP session used for all requests (subclasses may return a caching session)"""
+        return requests.Session()
+    
     def get_page(self, url: str, **kwargs) -> requests.Response:
         """
         Make a GET request
@@ -58,32 +193,95 @@ class BaseScraper:
         """
         return self.session.get(url, **kwargs)
     
-    def save_to_csv(self, data: List[Dict], filename: str):
+    @staticmethod
+    def _as_rows(data: List[Any]) -> List[Dict]:
+        """Convert typed results (e.g. ParcelResult) to plain dict rows; dicts pass through"""
+        return [row.to_dict() if hasattr(row, 'to_dict') else row for row in data]
+    
+    @staticmethod
+    def _collect_fieldnames(data: List[Dict]) -> List[str]:
+        """Union of keys across all records, in first-seen order"""
+        return list(dict.fromkeys(key for row in data for key in row))
+    
+    def save_to_csv(self, data: List[Any], filename: str):
         """Save scraped data to CSV file"""
         if not data:
             print("No data to save")
             return
         
-        df = pd.DataFrame(data)
-        df.to_csv(filename, index=False)
+        data = self._as_rows(data)
+        with atomic_output(filename) as tmp_filename:
+            with open(tmp_filename, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(f, fieldnames=self._collect_fieldnames(data))
+                writer.writeheader()
+                writer.writerows(data)
         print(f"Data saved to {filename}")
     
-    def save_to_excel(self, data: List[Dict], filename: str):
+    @contextmanager
+    def open_csv_writer(self, filename: str, fieldnames: List[str]):
+        """
+        Open a CSV file for streaming rows one at a time
+        
+        Args:
+            filename: Output CSV path
+            fieldnames: Column names written as the header row
+            
+        Yields:
+            Function taking a single record (dict or ParcelResult) and appending it to the file
+        """
+        with atomic_output(filename) as tmp_filename:
+            with open(tmp_filename, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(f, fieldnames=fieldnames)
+                writer.writeheader()
+                
+                def write_row(row: Any):
+                    writer.writerow(row.to_dict() if hasattr(row, 'to_dict') else row)
+                
+                yield write_row
+        print(f"Data saved to {filename}")
+    
+    def save_to_excel(self, data: List[Any], filename: str):
         """Save scraped data to Excel file"""
         if not data:
             print("No data to save")
             return
         
-        df = pd.DataFrame(data)
-        df.to_excel(filename, index=False, engine='openpyxl')
+        data = self._as_rows(data)
+        headers = self._collect_fieldnames(data)
+        wb = openpyxl.Workbook(write_only=True)
+        ws = wb.create_sheet('Sheet1')
+        ws.append(headers)
+        for row in data:
+            # Nested values (lists/dicts) are written as their string form
+            ws.append([
+                value if value is None or isinstance(value, (str, int, float, bool)) else str(value)
+                for value in (row.get(header) for header in headers)
+            ])
+        with atomic_output(filename) as tmp_filename:
+            wb.save(tmp_filename)
         print(f"Data saved to {filename}")
+    
+    def save_to_json(self, data: List[Any], filename: str, pretty: bool = False):
+        """
+        Save scraped data as a JSON array (dates as ISO strings, Decimals as numbers,
+        other non-JSON values as strings)
+        
+        Args:
+            data: Records (dicts or ParcelResult)
+            filename: Output JSON path
+            pretty: Indent the output for reading; compact output is smaller and faster to write
+        """
+        data = self._as_rows(data)
+        write_json(data, filename, pretty)
 
 
 class Website1Scraper(BaseScraper):
     """Scraper for Green Lake Transcendent Tech Land Records"""
     
     def __init__(self, base_url: str = "https://greenlake.transcendenttech.com/LandRecords", 
-                 username: Optional[str] = None, password: Optional[str] = None):
+                 username: Optional[str] = None, password: Optional[str] = None,
+                 max_workers: int = 4, requests_per_second: float = 4.0,
+                 cache_name: Optional[str] = "website1_cache", cache_expire_after: int = 3600):
         """
         Initialize Website 1 scraper
         
@@ -91,10 +289,38 @@ class Website1Scraper(BaseScraper):
             base_url: Base URL for the website
             username: Optional username for login
             password: Optional password for login
+            max_workers: Number of parcels scraped concurrently
+            requests_per_second: Maximum API request rate shared by all workers
+            cache_name: SQLite cache file for API GET responses (None disables caching;
+                        requires the requests-cache package)
+            cache_expire_after: Seconds before a cached API response is refetched
         """
+        self.cache_name = cache_name
+        self.cache_expire_after = cache_expire_after
         super().__init__(base_url)
         self.username = username
         self.password = password
+        self.max_workers = max_workers
+        self.rate_limiter = RateLimiter(requests_per_second)
+        
+        # API endpoints never change for a scraper instance, so build them once
+        self._search_url = f"{self.base_url}/api/RealEstateTaxParcelService"
+        self._tax_bill_url = f"{self.base_url}/api/TaxBillService/"
+    
+    def _create_session(self) -> requests.Session:
+        """Cache the idempotent API GETs on disk when requests-cache is available"""
+        if self.cache_name and requests_cache is not None:
+            return requests_cache.CachedSession(
+                self.cache_name,
+                backend='sqlite',
+                expire_after=self.cache_expire_after,
+                allowable_methods=('GET',),
+                # Unknown parcels/bills (404) are cached too, so repeat runs don't re-ask for them
+                allowable_codes=(200, 404),
+                # Only API responses; the login page must always be fetched to set cookies
+                filter_fn=lambda response: '/api/' in response.url
+            )
+        return super()._create_session()
     
     def login(self):
         """Establish a session by accessing the search page to get cookies"""
@@ -121,7 +347,7 @@ class Website1Scraper(BaseScraper):
         if not self.session.cookies:
             self.login()
         
-        url = f"{self.base_url}/api/RealEstateTaxParcelService"
+        url = self._search_url
         params = {
             'municipality': '',
             'parcelNum': parcel_number,
@@ -145,6 +371,7 @@ class Website1Scraper(BaseScraper):
             'tagInd': '0'
         }
         
+        self.rate_limiter.wait()
         response = self.session.get(url, params=params, timeout=30)
         response.raise_for_status()
         return response
@@ -159,12 +386,13 @@ class Website1Scraper(BaseScraper):
         Returns:
             Response object with tax bill details
         """
-        url = f"{self.base_url}/api/TaxBillService/{parcel_id}"
+        url = self._tax_bill_url + parcel_id
+        self.rate_limiter.wait()
         response = self.session.get(url, timeout=30)
         response.raise_for_status()
         return response
     
-    def scrape_parcel(self, parcel_number: str) -> Dict[str, Any]:
+    def scrape_parcel(self, parcel_number: str) -> ParcelResult:
         """
         Scrape a single parcel by combining search and tax bill data
         
@@ -172,131 +400,151 @@ class Website1Scraper(BaseScraper):
             parcel_number: Parcel number to scrape
             
         Returns:
-            Dictionary containing combined parcel and tax bill data
+            ParcelResult containing combined parcel and tax bill data
         """
         try:
             # Search for parcel
             search_response = self.search_parcels(parcel_number)
+            # Read the raw body once; every parse below works on these bytes
+            search_body = search_response.content
             
             # Check if response is empty
-            if not search_response.text or not search_response.text.strip():
-                return {'ParcelNumber': parcel_number, 'Error': 'Empty response from search API'}
+            if not search_body or not search_body.strip():
+                return ParcelResult(parcel_number, error='Empty response from search API')
             
-            # Parse XML response (API returns XML, not JSON)
+            # Dispatch on the declared content type so JSON bodies never pay for a failed XML parse
             try:
-                root = ET.fromstring(search_response.text)
-                # Convert XML to list of dictionaries
-                search_data = []
-                # Look for parcel items in the XML
-                # The XML structure may vary, so we'll try to find common elements
-                for item in root.findall('.//{http://schemas.datacontract.org/2004/07/LRS.Providers.ServiceViewModels.PropertyListing.RealEstateTaxParcel}RealEstateTaxParcelVm'):
-                    parcel_dict = {}
-                    for child in item:
-                        # Remove namespace prefix from tag name
-                        tag_name = child.tag.split('}')[-1] if '}' in child.tag else child.tag
-                        parcel_dict[tag_name] = child.text if child.text else ''
-                    if parcel_dict:
-                        search_data.append(parcel_dict)
-                
-                # If no structured data found, try parsing as simple XML
-                if not search_data:
-                    # Try alternative parsing - maybe the structure is different
-                    # Parse all elements and create a flat structure
-                    for elem in root.iter():
-                        if elem.text and elem.text.strip():
-                            tag_name = elem.tag.split('}')[-1] if '}' in elem.tag else elem.tag
-                            if tag_name not in ['RealEstateTaxParcelResultsVm', 'RealEstateTaxParcelVm']:
-                                if not search_data:
-                                    search_data.append({})
-                                search_data[0][tag_name] = elem.text.strip()
+                if _is_json_response(search_response):
+                    search_data = json.loads(search_body)
+                else:
+                    # Parse XML response (API returns XML by default)
+                    root = _parse_xml(search_body)
+                    # Convert XML to list of dictionaries
+                    search_data = []
+                    # Look for parcel items in the XML
+                    # The XML structure may vary, so we'll try to find common elements
+                    for item in PARCEL_XPATH(root):
+                        # Key by local tag name (namespace stripped)
+                        parcel_dict = {
+                            _localname(child.tag): (child.text or '')
+                            for child in item.iterchildren(etree.Element)
+                        }
+                        if parcel_dict:
+                            search_data.append(parcel_dict)
+                    
+                    # If no structured data found, try parsing as simple XML
+                    if not search_data:
+                        # Try alternative parsing - maybe the structure is different
+                        # Flatten every text-bearing leaf into a single record
+                        flat = {
+                            _localname(elem.tag): ''.join(elem.itertext()).strip()
+                            for elem in TEXT_LEAVES_XPATH(root)
+                        }
+                        flat.pop('RealEstateTaxParcelResultsVm', None)
+                        flat.pop('RealEstateTaxParcelVm', None)
+                        if flat:
+                            search_data.append(flat)
                 
-            except ET.ParseError as e:
-                # Try JSON as fallback
+            except etree.XMLSyntaxError as e:
+                # Untyped or mislabelled bodies may still be JSON
                 try:
-                    search_data = search_response.json()
+                    search_data = json.loads(search_body)
                 except ValueError:
                     error_msg = f'Invalid XML/JSON response: {str(e)}'
-                    response_preview = search_response.text[:200] if search_response.text else 'Empty'
-                    print(f"DEBUG - Parcel {parcel_number}: Response preview: {response_preview}")
-                    return {'ParcelNumber': parcel_number, 'Error': error_msg, 'ResponsePreview': response_preview}
+                    response_preview = search_body[:200].decode('utf-8', 'replace')
+                    logger.debug("Parcel %s: Response preview: %s", parcel_number, response_preview)
+                    return ParcelResult(parcel_number, error=error_msg, response_preview=response_preview)
             except Exception as e:
                 error_msg = f'Error parsing response: {str(e)}'
-                response_preview = search_response.text[:200] if search_response.text else 'Empty'
-                print(f"DEBUG - Parcel {parcel_number}: Response preview: {response_preview}")
-                return {'ParcelNumber': parcel_number, 'Error': error_msg, 'ResponsePreview': response_preview}
+                response_preview = search_body[:200].decode('utf-8', 'replace')
+                logger.debug("Parcel %s: Response preview: %s", parcel_number, response_preview)
+                return ParcelResult(parcel_number, error=error_msg, response_preview=response_preview)
             
             if not search_data or len(search_data) == 0:
-                return {'ParcelNumber': parcel_number, 'Error': 'No results found'}
+                return ParcelResult(parcel_number, error='No results found')
             
             # Get the first result's ParcelId
             parcel_id = search_data[0].get('ParcelId')
             if not parcel_id:
-                return {'ParcelNumber': parcel_number, 'Error': 'No ParcelId found'}
+                return ParcelResult(parcel_number, error='No ParcelId found')
             
             # Get tax bill
             tax_response = self.get_tax_bill(str(parcel_id))
+            tax_body = tax_response.content
             
             # Check if tax response is empty
-            if not tax_response.text or not tax_response.text.strip():
-                return {
-                    'ParcelNumber': parcel_number,
-                    'SearchData': search_data,
-                    'Error': 'Empty response from tax bill API'
-                }
+            if not tax_body or not tax_body.strip():
+                return ParcelResult(parcel_number, search_data, error='Empty response from tax bill API')
             
-            # Parse XML response (API returns XML, not JSON)
+            # Same content-type dispatch as the search response
             try:
-                tax_root = ET.fromstring(tax_response.text)
-                # Convert XML to dictionary
-                tax_data = {}
-                # Parse all elements in the tax bill XML
-                for elem in tax_root.iter():
-                    if elem.text and elem.text.strip():
-                        tag_name = elem.tag.split('}')[-1] if '}' in elem.tag else elem.tag
-                        # Skip root element names
-                        if tag_name not in ['TaxBillVm', 'TaxBillResultsVm']:
-                            tax_data[tag_name] = elem.text.strip()
-            except ET.ParseError as e:
-                # Try JSON as fallback
+                if _is_json_response(tax_response):
+                    tax_data = json.loads(tax_body)
+                else:
+                    # Parse XML response (API returns XML by default)
+                    # Convert XML to dictionary
+                    tax_data = {}
+                    # Stream-parse the tax bill XML, clearing each element once read to cap memory
+                    for _, elem in etree.iterparse(io.BytesIO(tax_body), events=('end',), huge_tree=True):
+                        if elem.text and elem.text.strip():
+                            tag_name = _localname(elem.tag)
+                            # Skip root element names
+                            if tag_name not in ['TaxBillVm', 'TaxBillResultsVm']:
+                                tax_data[tag_name] = elem.text.strip()
+                        elem.clear()
+                        # Also drop the already-read siblings, or the parent keeps every (empty) element
+                        while elem.getprevious() is not None:
+                            del elem.getparent()[0]
+            except etree.XMLSyntaxError as e:
+                # Untyped or mislabelled bodies may still be JSON
                 try:
-                    tax_data = tax_response.json()
+                    tax_data = json.loads(tax_body)
                 except ValueError:
                     error_msg = f'Invalid XML/JSON in tax bill response: {str(e)}'
-                    tax_preview = tax_response.text[:200] if tax_response.text else 'Empty'
-                    print(f"DEBUG - Parcel {parcel_number}: Tax response preview: {tax_preview}")
-                    return {
-                        'ParcelNumber': parcel_number,
-                        'SearchData': search_data,
-                        'Error': error_msg,
-                        'TaxResponsePreview': tax_preview
-                    }
+                    tax_preview = tax_body[:200].decode('utf-8', 'replace')
+                    logger.debug("Parcel %s: Tax response preview: %s", parcel_number, tax_preview)
+                    return ParcelResult(parcel_number, search_data, error=error_msg, tax_response_preview=tax_preview)
             except Exception as e:
                 error_msg = f'Error parsing tax bill response: {str(e)}'
-                tax_preview = tax_response.text[:200] if tax_response.text else 'Empty'
-                print(f"DEBUG - Parcel {parcel_number}: Tax response preview: {tax_preview}")
-                return {
-                    'ParcelNumber': parcel_number,
-                    'SearchData': search_data,
-                    'Error': error_msg,
-                    'TaxResponsePreview': tax_preview
-                }
+                tax_preview = tax_body[:200].decode('utf-8', 'replace')
+                logger.debug("Parcel %s: Tax response preview: %s", parcel_number, tax_preview)
+                return ParcelResult(parcel_number, search_data, error=error_msg, tax_response_preview=tax_preview)
             
             # Combine search and tax data
-            result = {
-                'ParcelNumber': parcel_number,
-                'SearchData': search_data,
-                'TaxBillData': tax_data
-            }
-            
-            return result
+            return ParcelResult(parcel_number, search_data, tax_data)
             
         except requests.RequestException as e:
-            return {'ParcelNumber': parcel_number, 'Error': str(e)}
+            return ParcelResult(parcel_number, error=str(e))
         except Exception as e:
-            return {'ParcelNumber': parcel_number, 'Error': f'Unexpected error: {str(e)}'}
+            return ParcelResult(parcel_number, error=f'Unexpected error: {str(e)}')
             
     
-    def scrape(self, parcel_numbers: List[str]) -> List[Dict[str, Any]]:
+    def iter_scrape(self, parcel_numbers: List[str]) -> Iterator[ParcelResult]:
+        """
+        Scrape multiple parcels, yielding each result in input order as it completes
+        
+        Args:
+            parcel_numbers: List of parcel numbers to scrape
+            
+        Yields:
+            ParcelResult records, one per parcel number
+        """
+        if not parcel_numbers:
+            return
+        
+        # Establish session cookies once before workers share the session
+        if not self.session.cookies:
+            self.login()
+        
+        def scrape_one(parcel_number: str) -> ParcelResult:
+            print(f"Scraping parcel: {parcel_number}")
+            return self.scrape_parcel(parcel_number)
+        
+        # Requests are paced by self.rate_limiter; results keep the input order
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            yield from executor.map(scrape_one, parcel_numbers)
+    
+    def scrape(self, parcel_numbers: List[str]) -> List[ParcelResult]:
         """
         Scrape multiple parcels
         
@@ -304,16 +552,199 @@ class Website1Scraper(BaseScraper):
             parcel_numbers: List of parcel numbers to scrape
             
         Returns:
-            List of dictionaries containing scraped data
+            List of ParcelResult records, one per parcel number
         """
-        results = []
-        for parcel_number in parcel_numbers:
-            print(f"Scraping parcel: {parcel_number}")
-            result = self.scrape_parcel(parcel_number)
-            results.append(result)
-            time.sleep(1)  # Be respectful with rate limiting
+        return list(self.iter_scrape(parcel_numbers))
+    
+    def scrape_to_csv(self, parcel_numbers: List[str], filename: str) -> int:
+        """
+        Scrape multiple parcels, writing each result to CSV as soon as it is ready
         
-        return results
+        Memory use stays flat regardless of how many parcels are scraped.
+        
+        Args:
+            parcel_numbers: List of parcel numbers to scrape
+            filename: Output CSV path
+            
+        Returns:
+            Number of rows written
+        """
+        count = 0
+        with self.open_csv_writer(filename, ParcelResult.fieldnames()) as write_row:
+            for result in self.iter_scrape(parcel_numbers):
+                write_row(result)
+                count += 1
+        return count
+
+
+# Elements whose content is never visible page text
+_INVISIBLE_TAGS = frozenset(('script', 'style', 'template'))
+
+# Plain (non lxml.html) HTML parser for the tax page: no per-element Python class lookup while walking the tree
+_TAX_HTML_PARSER = etree.HTMLParser()
+
+
+def _parse_html_document(html: str):
+    """
+    Parse an HTML page into a plain lxml tree rooted at <html>
+    
+    Args:
+        html: HTML content
+        
+    Returns:
+        Root element, or None if the document is empty
+    """
+    try:
+        return etree.fromstring(html, _TAX_HTML_PARSER)
+    except ValueError:
+        # Strings carrying an XML encoding declaration must be parsed as bytes
+        return etree.fromstring(html.encode('utf-8'), _TAX_HTML_PARSER)
+
+
+def _iter_visible_text(elem) -> Iterator[str]:
+    """
+    Yield the text pieces of a subtree in document order, leaving out script/style/template
+    content and comments. A single iterwalk avoids evaluating an ancestor:: test per text node.
+    
+    Args:
+        elem: Root of the subtree (its own tail is not part of it)
+        
+    Yields:
+        Text and tail strings
+    """
+    hidden = 0
+    for event, node in etree.iterwalk(elem, events=('start', 'end', 'comment', 'pi')):
+        if event == 'start':
+            if node.tag in _INVISIBLE_TAGS:
+                hidden += 1
+            elif not hidden and node.text:
+                yield node.text
+            continue
+        if event == 'end' and node.tag in _INVISIBLE_TAGS:
+            hidden -= 1
+        # Comments and processing instructions only contribute their tail
+        if not hidden and node.tail and node is not elem:
+            yield node.tail
+
+
+def _element_text(elem) -> str:
+    """Concatenated visible text of an element with each piece stripped"""
+    return ''.join(text.strip() for text in _iter_visible_text(elem))
+
+
+def _element_classes(elem) -> str:
+    """Class attribute normalised to single-space separated names"""
+    return ' '.join(elem.get('class', '').split())
+
+
+def _attr_contains_any(attr: str, keywords: tuple) -> str:
+    """XPath predicate: ASCII case-insensitive substring match of any keyword in an attribute"""
+    lowered = f"translate({attr}, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+    return ' or '.join(f"contains({lowered}, '{keyword}')" for keyword in keywords)
+
+
+# Brown County tax page: tax-related elements by id/class, and tax sections by id. Selecting them
+# with one compiled XPath each keeps the matching in libxml2 instead of a Python regex per node.
+_TAX_ELEMENTS_XPATH = etree.XPath(
+    f"//*[{_attr_contains_any('@id', ('tax', 'bill'))} or "
+    f"{_attr_contains_any('@class', ('tax', 'bill', 'amount', 'due'))}]"
+)
+_TAX_CONTAINERS_XPATH = etree.XPath(
+    f"//*[(self::div or self::section) and "
+    f"({_attr_contains_any('@id', ('tax', 'bill', 'payment', 'assessment'))})]"
+)
+
+# Tax History table: output key -> column header, and the columns that identify the table
+_TAX_HISTORY_FIELDS = {
+    'year': 'Year',
+    'amount': 'Amount',
+    'interest_paid': 'Interest Paid',
+    'penalties_paid': 'Penalties Paid',
+    'paid': 'Paid',
+    'last_paid': 'Last Paid',
+    'amount_due': 'Amount Due',
+    'status': 'Status',
+}
+_TAX_HISTORY_COLUMNS = frozenset(['Interest Paid', 'Penalties Paid', 'Paid', 'Last Paid', 'Amount Due', 'Status'])
+
+# Property info table: headers that identify it, and (words in header, output key) rules, first match wins
+_PROPERTY_TABLE_HEADERS = frozenset(['Parcel Number', 'Property Address', 'Municipality', 'Owner'])
+_PROPERTY_HEADER_RULES = (
+    (('parcel', 'number'), 'parcel_number'),
+    (('property', 'address'), 'property_address'),
+    (('billing', 'address'), 'billing_address'),
+    (('municipality',), 'municipality'),
+    (('owner',), 'owner'),
+    (('tax', 'year'), 'tax_year'),
+    (('prop', 'type'), 'property_type'),
+)
+
+
+@lru_cache(maxsize=256)
+def _property_detail_key(header: str) -> Optional[str]:
+    """Normalized property_details key for a property table header (None if not a tracked column)"""
+    header_lower = header.lower()
+    for words, key in _PROPERTY_HEADER_RULES:
+        if all(word in header_lower for word in words):
+            return key
+    return None
+
+
+# Value patterns scanned for in the tax page text (year group is non-capturing so findall returns whole years)
+_AMOUNT_RE = re.compile(r'\$[\d,]+\.?\d*')
+_YEAR_RE = re.compile(r'\b(?:19|20)\d{2}\b')
+_PARCEL_RE = re.compile(r'\d+[-.]?\d+[-.]?\d+')
+
+
+# ASP.NET WebForms hidden fields extracted from every Brown County response
+ASPNET_TOKEN_NAMES = [
+    '__VIEWSTATE',
+    '__VIEWSTATEGENERATOR',
+    '__EVENTVALIDATION',
+    '__VIEWSTATEENCRYPTED',
+    '__PREVIOUSPAGE',
+    '__EVENTARGUMENT',
+    '__EVENTTARGET',
+    '__LASTFOCUS',
+    '__SCROLLPOSITIONX',
+    '__SCROLLPOSITIONY',
+    'ctl00_cphMainApp_ToolkitScriptManager1_HiddenField',
+]
+_TOKEN_NAME_SET = frozenset(ASPNET_TOKEN_NAMES)
+
+
+# Single XPath selecting every token input by name (or id) in one traversal
+_TOKEN_INPUTS_XPATH = etree.XPath(
+    '//input[' + ' or '.join(f"@name='{name}' or @id='{name}'" for name in ASPNET_TOKEN_NAMES) + ']'
+)
+
+
+def iter_aspnet_ajax_deltas(response_text: str):
+    """
+    Iterate over the entries of an ASP.NET AJAX partial-postback response
+    Format: "length|type|id|content|" repeated, where length is the content length
+    
+    Args:
+        response_text: Raw ASP.NET AJAX response
+        
+    Yields:
+        Tuples of (type, id, content)
+    """
+    pos = 0
+    while pos < len(response_text):
+        length_end = response_text.find('|', pos)
+        type_end = response_text.find('|', length_end + 1) if length_end != -1 else -1
+        id_end = response_text.find('|', type_end + 1) if type_end != -1 else -1
+        if id_end == -1:
+            return
+        try:
+            length = int(response_text[pos:length_end])
+        except ValueError:
+            return
+        content_start = id_end + 1
+        content_end = content_start + length
+        yield response_text[length_end + 1:type_end], response_text[type_end + 1:id_end], response_text[content_start:content_end]
+        pos = content_end + 1
 
 
 def extract_aspnet_tokens(html: str) -> Dict[str, str]:
@@ -321,65 +752,118 @@ def extract_aspnet_tokens(html: str) -> Dict[str, str]:
     Extract ASP.NET WebForms tokens from HTML response
     
     Args:
-        html: HTML content to parse
+        html: HTML content to parse (or an ASP.NET AJAX partial-postback response)
         
     Returns:
         Dictionary containing extracted tokens
     """
-    tokens = {}
-    
-    def extract_hidden_field(field_name: str) -> Optional[str]:
-        """Extract hidden field value by name using multiple patterns"""
-        patterns = [
-            re.compile(rf'<input[^>]*name=["\']{re.escape(field_name)}["\'][^>]*value=["\']([^"\']*)["\']', re.I),
-            re.compile(rf'<input[^>]*value=["\']([^"\']*)["\'][^>]*name=["\']{re.escape(field_name)}["\']', re.I),
-            re.compile(rf'id=["\']{re.escape(field_name)}["\'][^>]*value=["\']([^"\']*)["\']', re.I),
-        ]
-        
-        for pattern in patterns:
-            match = pattern.search(html)
-            if match and match.group(1):
-                return match.group(1)
-        
-        # Check if field exists but is empty
-        empty_pattern = re.compile(rf'name=["\']{re.escape(field_name)}["\']', re.I)
-        if empty_pattern.search(html):
-            return ''
-        
-        return None
-    
-    # List of ASP.NET tokens to extract
-    tokens_to_extract = [
-        '__VIEWSTATE',
-        '__VIEWSTATEGENERATOR',
-        '__EVENTVALIDATION',
-        '__VIEWSTATEENCRYPTED',
-        '__PREVIOUSPAGE',
-        '__EVENTARGUMENT',
-        '__EVENTTARGET',
-        '__LASTFOCUS',
-        '__SCROLLPOSITIONX',
-        '__SCROLLPOSITIONY'
-    ]
-    
-    for token_name in tokens_to_extract:
-        value = extract_hidden_field(token_name)
-        if value is not None:
-            tokens[token_name] = value
-    
-    # Also extract toolkit hidden field if present
-    toolkit_field = extract_hidden_field('ctl00_cphMainApp_ToolkitScriptManager1_HiddenField')
-    if toolkit_field is not None:
-        tokens['ctl00_cphMainApp_ToolkitScriptManager1_HiddenField'] = toolkit_field
-    
-    return tokens
+    if not html or not html.strip():
+        return {}
+    
+    # Callers merge the result into their own token dicts, so hand out a fresh copy each time
+    return dict(_extract_aspnet_tokens_cached(html))
+
+
+# Small and keyed on the full page text: retries and the Selenium fallback often re-read an
+# unchanged page, and an equal-string lookup is far cheaper than re-parsing it
+@lru_cache(maxsize=8)
+def _extract_aspnet_tokens_cached(html: str) -> tuple:
+    """Token (name, value) pairs of a non-empty page, in canonical order"""
+    # Partial postbacks carry updated tokens as hiddenField entries rather than <input> tags
+    if '|hiddenField|' in html:
+        found = {
+            field_id: content
+            for field_type, field_id, content in iter_aspnet_ajax_deltas(html)
+            if field_type == 'hiddenField' and field_id in _TOKEN_NAME_SET
+        }
+        return tuple((name, found[name]) for name in ASPNET_TOKEN_NAMES if name in found)
+    
+    try:
+        try:
+            tree = lxml.html.fromstring(html, parser=_HTML_PARSER)
+        except ValueError:
+            # Strings carrying an XML encoding declaration must be parsed as bytes
+            tree = lxml.html.fromstring(html.encode('utf-8'), parser=_HTML_PARSER)
+    except etree.ParserError:
+        return ()
+    
+    found = {}
+    for inp in _TOKEN_INPUTS_XPATH(tree):
+        name = inp.get('name') if inp.get('name') in _TOKEN_NAME_SET else inp.get('id')
+        value = inp.get('value', '')
+        # Keep the first non-empty value seen for each field
+        if not found.get(name):
+            found[name] = value
+    
+    # Return tokens in the canonical order
+    return tuple((name, found[name]) for name in ASPNET_TOKEN_NAMES if name in found)
 
 
 class BrownCountyScraper(BaseScraper):
     """Scraper for Brown County Land Records (ASP.NET WebForms)"""
     
+    # Constant fields of the accept-terms postback
+    _ACCEPT_FORM_FIELDS = (
+        ('__SCROLLPOSITIONX', '0'),
+        ('__SCROLLPOSITIONY', '0'),
+        ('ctl00$cphMainApp$pageWidth', '1890'),
+        ('ctl00$cphMainApp$pageHeight', '1034'),
+        ('ctl00$cphMainApp$ParcelSearchCriteria1$PropertyType', 'optRealEstate'),
+        ('ctl00$cphMainApp$ParcelSearchCriteria1$mtxtParcelNumber', ''),
+        ('ctl00$cphMainApp$ParcelSearchCriteria1$txtLastName', ''),
+        ('ctl00$cphMainApp$ParcelSearchCriteria1$txtFirstName', ''),
+        ('ctl00$cphMainApp$ParcelSearchCriteria1$ddlOwnerStatus', 'ALLBUTFORMER'),
+        ('ctl00$cphMainApp$ParcelSearchCriteria1$txtHouseNumber', ''),
+        ('ctl00$cphMainApp$ParcelSearchCriteria1$ddlPrefixDir', ''),
+        ('ctl00$cphMainApp$ParcelSearchCriteria1$txtStreetName', ''),
+        ('ctl00$cphMainApp$ParcelSearchCriteria1$ddlStreetType', ''),
+        ('ctl00$cphMainApp$ParcelSearchCriteria1$ddlSuffixDir', ''),
+        ('ctl00$cphMainApp$ParcelSearchCriteria1$ddlMunicipality', ''),
+        ('ctl00$cphMainApp$ParcelSearchCriteria1$cbCurrentProperties', 'on'),
+        ('ctl00$cphMainApp$ParcelSearchCriteria1$cbHistoricalProperties', 'on'),
+        ('ctl00$cphMainApp$btnEntryPageAccept', 'I Accept'),
+    )
+    _ACCEPT_FORM_ENCODED = urlencode(_ACCEPT_FORM_FIELDS)
+    
+    # Constant fields of the parcel search postback
+    _SEARCH_FORM_FIELDS = (
+        ('ctl00$cphMainApp$ToolkitScriptManager1', 'ctl00$cphMainApp$upSearch|ctl00$cphMainApp$ButtonParcelSearch'),
+        ('__EVENTTARGET', 'cphMainApp$ButtonParcelSearch'),
+        ('__EVENTARGUMENT', ''),
+        ('__SCROLLPOSITIONX', '0'),
+        ('__SCROLLPOSITIONY', '0'),
+        ('ctl00$cphMainApp$pageWidth', '1149'),
+        ('ctl00$cphMainApp$pageHeight', '1034'),
+        ('ctl00$cphMainApp$ParcelSearchCriteria1$PropertyType', 'optRealEstate'),
+        ('ctl00$cphMainApp$ParcelSearchCriteria1$mtxtAltParcelNumber', ''),
+        ('ctl00$cphMainApp$ParcelSearchCriteria1$txtLastName', ''),
+        ('ctl00$cphMainApp$ParcelSearchCriteria1$txtFirstName', ''),
+        ('ctl00$cphMainApp$ParcelSearchCriteria1$ddlOwnerStatus', 'ALLBUTFORMER'),
+        ('ctl00$cphMainApp$ParcelSearchCriteria1$txtHouseNumber', ''),
+        ('ctl00$cphMainApp$ParcelSearchCriteria1$ddlPrefixDir', ''),
+        ('ctl00$cphMainApp$ParcelSearchCriteria1$txtStreetName', ''),
+        ('ctl00$cphMainApp$ParcelSearchCriteria1$ddlStreetType', ''),
+        ('ctl00$cphMainApp$ParcelSearchCriteria1$ddlSuffixDir', ''),
+        ('ctl00$cphMainApp$ParcelSearchCriteria1$DropDownListPlatType', 'All'),
+        ('ctl00$cphMainApp$ParcelSearchCriteria1$DropDownListPlatDesc', 'All'),
+        ('ctl00$cphMainApp$ParcelSearchCriteria1$ddlSection', ''),
+        ('ctl00$cphMainApp$ParcelSearchCriteria1$ddlTownship', ''),
+        ('ctl00$cphMainApp$ParcelSearchCriteria1$ddlTownshipDir', ''),
+        ('ctl00$cphMainApp$ParcelSearchCriteria1$ddlRange', ''),
+        ('ctl00$cphMainApp$ParcelSearchCriteria1$ddlRangeDir', ''),
+        ('ctl00$cphMainApp$ParcelSearchCriteria1$ddl40Quarter', ''),
+        ('ctl00$cphMainApp$ParcelSearchCriteria1$ddl160Quarter', ''),
+        ('ctl00$cphMainApp$ParcelSearchCriteria1$ddlMunicipality', ''),
+        ('ctl00$cphMainApp$ParcelSearchCriteria1$cbCurrentProperties', 'on'),
+        ('ctl00$cphMainApp$ParcelSearchCriteria1$cbHistoricalProperties', 'on'),
+        ('ctl00$cphMainApp$ButtonParcelSearch', 'Search For Properties'),
+    )
+    _SEARCH_FORM_ENCODED = urlencode(_SEARCH_FORM_FIELDS)
+    
     def __init__(self, base_url: str = "https://prod-landrecords.browncountywi.gov",
-                 headless: bool = True, selenium_timeout: int = 30):
+                 headless: bool = True, selenium_timeout: int = 30, max_workers: int = 1,
+                 debug: bool = False, token_cache_path: Optional[str] = ".brown_tokens.json",
+                 token_cache_ttl: int = 1800, parcels_per_second: float = 0.5):
         """
         Initialize Brown County scraper
         
@@ -387,12 +871,36 @@ class BrownCountyScraper(BaseScraper):
             base_url: Base URL for the website
             headless: Run browser in headless mode
             selenium_timeout: Timeout for Selenium operations in seconds
+            max_workers: Number of parcels scraped concurrently, each worker with its own
+                         session, tokens and (lazily started) browser
+            debug: Keep the raw taxes response and element HTML snippets in get_tax_info results
+            token_cache_path: JSON file holding the post-terms tokens and cookies so later parcels
+                              and runs can skip the cookie/terms steps (None disables persistence;
+                              only used when parcels are scraped one at a time)
+            token_cache_ttl: Seconds a saved session is reused before the terms are accepted again
+            parcels_per_second: Maximum rate at which parcels are started, shared by all workers
+                                (0 disables pacing)
         """
         super().__init__(base_url)
         self.headless = headless
         self.selenium_timeout = selenium_timeout
+        self.max_workers = max_workers
+        self.debug = debug
+        self.token_cache_path = token_cache_path
+        self.token_cache_ttl = token_cache_ttl
+        # Paces parcel starts; sleeps only for whatever part of the interval the last parcel didn't use
+        self.rate_limiter = RateLimiter(parcels_per_second)
         self.driver = None
+        self._wait = None
+        # Parcel of the last search postback, and the parcel the browser's page currently shows
+        self._parcel_number = None
+        self._browser_parcel = None
         self.tokens = {}
+        # Tokens and cookies captured right after accepting the terms (see _save_session_state)
+        self._session_state = None
+        # Nesting depth of `with` blocks; the driver and worker pool are only closed by the outermost exit
+        self._context_depth = 0
+        self._workers = []
         
         # Update headers for ASP.NET compatibility
         self.headers.update({
@@ -402,7 +910,23 @@ class BrownCountyScraper(BaseScraper):
         self.session.headers.update(self.headers)
     
     def _init_selenium(self):
-        """Initialize Selenium WebDriver and sync cookies from requests session"""
+        """
+        Initialize Selenium WebDriver and sync cookies from requests session
+        
+        A driver that is already running is reused; one whose browser has gone away is replaced.
+        
+        Returns:
+            The WebDriver instance
+        """
+        if self.driver is not None:
+            try:
+                self.driver.window_handles
+            except WebDriverException:
+                print("Selenium driver is no longer responding, starting a new one...")
+                self.driver = None
+                self._wait = None
+                self._browser_parcel = None
+        
         if self.driver is None:
             chrome_options = Options()
             if self.headless:
@@ -413,12 +937,25 @@ class BrownCountyScraper(BaseScraper):
             chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
             chrome_options.add_experimental_option('useAutomationExtension', False)
             chrome_options.add_argument(f'user-agent={self.headers["User-Agent"]}')
+            # Only the DOM is scraped: skip images and web fonts, and don't wait for them to load
+            chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+            chrome_options.add_argument('--disable-extensions')
+            chrome_options.add_argument('--disable-gpu')
+            chrome_options.add_experimental_option('prefs', {
+                'profile.managed_default_content_settings.images': 2,
+                'profile.managed_default_content_settings.fonts': 2,
+            })
+            chrome_options.page_load_strategy = 'eager'
             
             self.driver = webdriver.Chrome(options=chrome_options)
             self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            # Shared wait object for every explicit wait on this driver
+            self._wait = WebDriverWait(self.driver, self.selenium_timeout)
             
             # Sync cookies from requests session to Selenium
             self._sync_cookies_to_selenium()
+        
+        return self.driver
     
     def _sync_cookies_to_selenium(self):
         """Sync cookies from requests session to Selenium WebDriver"""
@@ -454,6 +991,191 @@ class BrownCountyScraper(BaseScraper):
         if self.driver:
             self.driver.quit()
             self.driver = None
+            self._wait = None
+            self._browser_parcel = None
+    
+    def __enter__(self):
+        """
+        Start a scraping run; the driver is created lazily and reused until the outermost exit
+        
+        Opening the scraper with `with` keeps the browser alive across several scrape() calls:
+            with BrownCountyScraper(...) as scraper:
+                scraper.scrape(batch1)
+                scraper.scrape(batch2)
+        """
+        self._context_depth += 1
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        """End a scraping run; the outermost exit closes the driver (if started), workers and pooled HTTP connections"""
+        self._context_depth = max(self._context_depth - 1, 0)
+        if self._context_depth == 0:
+            self._close_selenium()
+            self._close_workers()
+            # Cookies and tokens are kept; the session reconnects if used again
+            self.session.close()
+        return False
+    
+    def _extract_tokens_from_page(self) -> str:
+        """
+        Read the browser's current page and merge its ASP.NET tokens into self.tokens
+        
+        Returns:
+            The page source that was parsed
+        """
+        page_source = self.driver.page_source
+        self.tokens.update(extract_aspnet_tokens(page_source))
+        return page_source
+    
+    def _wait_for_page_load(self, old_root):
+        """
+        Wait for a full postback to replace the page
+        
+        Args:
+            old_root: The <html> element captured before the postback was triggered
+        """
+        self._wait.until(EC.staleness_of(old_root))
+        self._wait.until(lambda driver: driver.execute_script("return document.readyState") == "complete")
+    
+    def _arm_async_postback(self):
+        """
+        Flag the page as waiting for a postback, cleared by the PageRequestManager's endRequest event
+        
+        Call just before the click that triggers the postback so _wait_for_async_postback
+        cannot return before the request has even started. A full page load discards the flag.
+        """
+        self.driver.execute_script(
+            "if (window.Sys && Sys.WebForms) {"
+            "  var prm = Sys.WebForms.PageRequestManager.getInstance();"
+            "  window.__scraperPostbackPending = true;"
+            "  prm.add_endRequest(function done() {"
+            "    window.__scraperPostbackPending = false;"
+            "    prm.remove_endRequest(done);"
+            "  });"
+            "}"
+        )
+    
+    def _wait_for_async_postback(self):
+        """Wait for an ASP.NET AJAX partial postback (UpdatePanel refresh) or full postback to finish"""
+        self._wait.until(lambda driver: driver.execute_script(
+            "return document.readyState === 'complete' && window.__scraperPostbackPending !== true && "
+            "!(window.Sys && Sys.WebForms && Sys.WebForms.PageRequestManager.getInstance().get_isInAsyncPostBack());"
+        ))
+    
+    def _needs_browser(self, tokens: Dict[str, str]) -> bool:
+        """
+        Check whether a postback response is missing the tokens needed to continue without Selenium
+        
+        Args:
+            tokens: Tokens extracted from the response
+            
+        Returns:
+            True if the step should fall back to the browser
+        """
+        return not tokens.get('__VIEWSTATE')
+    
+    # Tokens a saved session must carry to replay the search postback
+    _SESSION_STATE_TOKENS = ('__VIEWSTATE', '__EVENTVALIDATION', '__VIEWSTATEGENERATOR')
+    
+    def _save_session_state(self):
+        """Remember the tokens and cookies right after accepting the terms (on disk too, if enabled)"""
+        if not all(self.tokens.get(name) for name in self._SESSION_STATE_TOKENS):
+            return
+        
+        self._session_state = {
+            'saved_at': time.time(),
+            'tokens': dict(self.tokens),
+            'cookies': [
+                {'name': cookie.name, 'value': cookie.value, 'domain': cookie.domain, 'path': cookie.path}
+                for cookie in self.session.cookies
+            ],
+        }
+        if not self.token_cache_path:
+            return
+        
+        # Written atomically, so another run never reads a partial file
+        try:
+            with atomic_output(self.token_cache_path) as tmp_path:
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(self._session_state, f)
+        except OSError as e:
+            print(f"Warning: Could not save session tokens: {e}")
+    
+    def _load_session_state(self) -> Optional[Dict[str, Any]]:
+        """Read a saved session from disk and restore its cookies (None if missing or unreadable)"""
+        if not self.token_cache_path or not os.path.exists(self.token_cache_path):
+            return None
+        try:
+            with open(self.token_cache_path, encoding='utf-8') as f:
+                state = json.load(f)
+            for cookie in state['cookies']:
+                self.session.cookies.set(cookie['name'], cookie['value'],
+                                         domain=cookie['domain'], path=cookie['path'])
+            state['tokens'] = dict(state['tokens'])
+            state['saved_at'] = float(state['saved_at'])
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            print(f"Warning: Ignoring unreadable session tokens file: {e}")
+            return None
+        return state
+    
+    def _restore_session_state(self) -> bool:
+        """
+        Reset self.tokens to a saved post-terms session if one is still fresh
+        
+        Returns:
+            True if the cookie and terms steps can be skipped
+        """
+        if self._session_state is None:
+            self._session_state = self._load_session_state()
+        state = self._session_state
+        if state is None:
+            return False
+        
+        if (time.time() - state['saved_at'] > self.token_cache_ttl
+                or not all(state['tokens'].get(name) for name in self._SESSION_STATE_TOKENS)):
+            self._discard_session_state()
+            return False
+        
+        self.tokens = dict(state['tokens'])
+        return True
+    
+    def _discard_session_state(self):
+        """Forget a saved session that expired or was rejected by the server"""
+        self._session_state = None
+        if self.token_cache_path:
+            try:
+                os.remove(self.token_cache_path)
+            except OSError:
+                pass
+    
+    def _search_with_saved_session(self, parcel_number: str) -> bool:
+        """
+        Search straight away with a saved post-terms session, skipping steps 1 and 2
+        
+        Args:
+            parcel_number: Parcel number to search for
+            
+        Returns:
+            True if the search succeeded; False if there is no usable saved session
+        """
+        if not self._restore_session_state():
+            return False
+        
+        print(f"Steps 1-3: Searching for parcel {parcel_number} with the saved session...")
+        try:
+            new_tokens = self._post_search(parcel_number, allow_redirects=False)
+        except requests.RequestException as e:
+            print(f"Saved session was rejected ({e}), starting a new one...")
+            self._discard_session_state()
+            return False
+        
+        if self._needs_browser(new_tokens):
+            print("Saved session has expired, starting a new one...")
+            self._discard_session_state()
+            return False
+        
+        print(f"Successfully searched for parcel {parcel_number}")
+        return True
     
     def get_cookie(self) -> Dict[str, str]:
         """
@@ -484,52 +1206,40 @@ class BrownCountyScraper(BaseScraper):
     
     def accept_terms(self) -> Dict[str, str]:
         """
-        Step 2: Accept terms and conditions, extract new tokens, and click button via Selenium
+        Step 2: Accept terms and conditions and extract new tokens
+        (falls back to clicking the button via Selenium if the response has no tokens)
         
         Returns:
             Dictionary containing extracted tokens after accepting terms
         """
         try:
-            # Prepare form data for POST request
-            form_data = {
-                'ctl00_cphMainApp_ToolkitScriptManager1_HiddenField': self.tokens.get('ctl00_cphMainApp_ToolkitScriptManager1_HiddenField', ''),
-                '__LASTFOCUS': self.tokens.get('__LASTFOCUS', ''),
-                '__EVENTTARGET': self.tokens.get('__EVENTTARGET', ''),
-                '__EVENTARGUMENT': self.tokens.get('__EVENTARGUMENT', ''),
-                '__VIEWSTATE': self.tokens.get('__VIEWSTATE', ''),
-                '__VIEWSTATEGENERATOR': self.tokens.get('__VIEWSTATEGENERATOR', ''),
-                '__SCROLLPOSITIONX': '0',
-                '__SCROLLPOSITIONY': '0',
-                '__VIEWSTATEENCRYPTED': self.tokens.get('__VIEWSTATEENCRYPTED', ''),
-                '__EVENTVALIDATION': self.tokens.get('__EVENTVALIDATION', ''),
-                'ctl00$cphMainApp$pageWidth': '1890',
-                'ctl00$cphMainApp$pageHeight': '1034',
-                'ctl00$cphMainApp$ParcelSearchCriteria1$PropertyType': 'optRealEstate',
-                'ctl00$cphMainApp$ParcelSearchCriteria1$mtxtParcelNumber': '',
-                'ctl00$cphMainApp$ParcelSearchCriteria1$txtLastName': '',
-                'ctl00$cphMainApp$ParcelSearchCriteria1$txtFirstName': '',
-                'ctl00$cphMainApp$ParcelSearchCriteria1$ddlOwnerStatus': 'ALLBUTFORMER',
-                'ctl00$cphMainApp$ParcelSearchCriteria1$txtHouseNumber': '',
-                'ctl00$cphMainApp$ParcelSearchCriteria1$ddlPrefixDir': '',
-                'ctl00$cphMainApp$ParcelSearchCriteria1$txtStreetName': '',
-                'ctl00$cphMainApp$ParcelSearchCriteria1$ddlStreetType': '',
-                'ctl00$cphMainApp$ParcelSearchCriteria1$ddlSuffixDir': '',
-                'ctl00$cphMainApp$ParcelSearchCriteria1$ddlMunicipality': '',
-                'ctl00$cphMainApp$ParcelSearchCriteria1$cbCurrentProperties': 'on',
-                'ctl00$cphMainApp$ParcelSearchCriteria1$cbHistoricalProperties': 'on',
-                'ctl00$cphMainApp$btnEntryPageAccept': 'I Accept'
-            }
+            # Token fields change per response; the constant fields are pre-encoded once
+            body = urlencode([
+                ('ctl00_cphMainApp_ToolkitScriptManager1_HiddenField', self.tokens.get('ctl00_cphMainApp_ToolkitScriptManager1_HiddenField', '')),
+                ('__LASTFOCUS', self.tokens.get('__LASTFOCUS', '')),
+                ('__EVENTTARGET', self.tokens.get('__EVENTTARGET', '')),
+                ('__EVENTARGUMENT', self.tokens.get('__EVENTARGUMENT', '')),
+                ('__VIEWSTATE', self.tokens.get('__VIEWSTATE', '')),
+                ('__VIEWSTATEGENERATOR', self.tokens.get('__VIEWSTATEGENERATOR', '')),
+                ('__VIEWSTATEENCRYPTED', self.tokens.get('__VIEWSTATEENCRYPTED', '')),
+                ('__EVENTVALIDATION', self.tokens.get('__EVENTVALIDATION', '')),
+            ]) + '&' + self._ACCEPT_FORM_ENCODED
             
             # POST request to accept terms
             url = f"{self.base_url}/"
-            response = self.session.post(url, data=form_data, timeout=30)
+            response = self.session.post(url, data=body, headers={'Content-Type': 'application/x-www-form-urlencoded'}, timeout=30)
             response.raise_for_status()
             
             # Extract new tokens
             new_tokens = extract_aspnet_tokens(response.text)
             self.tokens.update(new_tokens)
             
-            # Use Selenium to click the "I Accept" button
+            if not self._needs_browser(new_tokens):
+                print("Successfully accepted terms and extracted new tokens")
+                return self.tokens
+            
+            # Fall back to Selenium to click the "I Accept" button
+            print("Tokens missing from accept terms response, falling back to Selenium...")
             self._init_selenium()
             self.driver.get(url)
             # Sync cookies after navigation
@@ -537,18 +1247,17 @@ class BrownCountyScraper(BaseScraper):
             
             # Wait for and click the accept button
             try:
-                accept_button = WebDriverWait(self.driver, self.selenium_timeout).until(
+                accept_button = self._wait.until(
                     EC.element_to_be_clickable((By.ID, "ctl00_cphMainApp_btnEntryPageAccept"))
                 )
+                old_root = self.driver.find_element(By.TAG_NAME, 'html')
                 accept_button.click()
                 
-                # Wait for page to load
-                time.sleep(2)
+                # Wait for the postback to load the next page
+                self._wait_for_page_load(old_root)
                 
                 # Extract tokens from the new page
-                page_source = self.driver.page_source
-                final_tokens = extract_aspnet_tokens(page_source)
-                self.tokens.update(final_tokens)
+                self._extract_tokens_from_page()
                 
                 print("Successfully accepted terms and extracted new tokens")
                 return self.tokens
@@ -562,6 +1271,92 @@ class BrownCountyScraper(BaseScraper):
             print(f"Error in accept_terms: {e}")
             return self.tokens
     
+    def _post_search(self, parcel_number: str, allow_redirects: bool = True) -> Dict[str, str]:
+        """
+        Replay the parcel search postback over HTTP
+        
+        Args:
+            parcel_number: Parcel number to search for
+            allow_redirects: Follow redirects; if False a redirect is raised as an HTTPError
+            
+        Returns:
+            Tokens extracted from the response (also merged into self.tokens)
+            
+        Raises:
+            requests.RequestException: If the request fails
+        """
+        # Token fields and the parcel number change per request; the constant fields are pre-encoded once
+        body = urlencode([
+            ('ctl00_cphMainApp_ToolkitScriptManager1_HiddenField', self.tokens.get('ctl00_cphMainApp_ToolkitScriptManager1_HiddenField', '')),
+            ('__LASTFOCUS', self.tokens.get('__LASTFOCUS', '')),
+            ('__VIEWSTATE', self.tokens.get('__VIEWSTATE', '')),
+            ('__VIEWSTATEGENERATOR', self.tokens.get('__VIEWSTATEGENERATOR', '')),
+            ('__VIEWSTATEENCRYPTED', self.tokens.get('__VIEWSTATEENCRYPTED', '')),
+            ('__EVENTVALIDATION', self.tokens.get('__EVENTVALIDATION', '')),
+            ('ctl00$cphMainApp$ParcelSearchCriteria1$mtxtParcelNumber', parcel_number),
+        ]) + '&' + self._SEARCH_FORM_ENCODED
+        
+        # Set headers for AJAX request
+        headers = {
+            'Content-Type': 'application/x-www-form-urlencoded; charset=UTF-8',
+            'X-MicrosoftAjax': 'Delta=true',
+            'X-Requested-With': 'XMLHttpRequest',
+            'Referer': f'{self.base_url}/',
+            'Origin': self.base_url
+        }
+        
+        # POST request to search
+        url = f"{self.base_url}/Search.aspx"
+        self._parcel_number = parcel_number
+        response = self.session.post(url, data=body, headers=headers, timeout=30, allow_redirects=allow_redirects)
+        response.raise_for_status()
+        if response.is_redirect:
+            raise requests.HTTPError(f"Search redirected to {response.headers.get('Location')}", response=response)
+        
+        # Extract new tokens
+        new_tokens = extract_aspnet_tokens(response.text)
+        self.tokens.update(new_tokens)
+        return new_tokens
+    
+    def _search_selenium(self, parcel_number: str):
+        """
+        Fill in the search form and click the search button in the browser
+        
+        Args:
+            parcel_number: Parcel number to search for
+            
+        Raises:
+            TimeoutException, NoSuchElementException: If the search form or results don't appear
+        """
+        self._init_selenium()
+        # Navigate to search page if not already there
+        if 'Search.aspx' not in self.driver.current_url:
+            # driver.get blocks until the DOM is ready (eager page load strategy)
+            self.driver.get(f"{self.base_url}/Search.aspx")
+            # Sync cookies after navigation
+            self._sync_cookies_from_selenium()
+        
+        # Fill in parcel number
+        parcel_input = self._wait.until(
+            EC.presence_of_element_located((By.ID, "mtxtParcelNumber"))
+        )
+        parcel_input.clear()
+        parcel_input.send_keys(parcel_number)
+        
+        # Click search button
+        search_button = self._wait.until(
+            EC.element_to_be_clickable((By.ID, "ButtonParcelSearch"))
+        )
+        self._arm_async_postback()
+        search_button.click()
+        
+        # Wait for the search UpdatePanel to refresh with results
+        self._wait_for_async_postback()
+        self._browser_parcel = parcel_number
+        
+        # Extract tokens from the new page
+        self._extract_tokens_from_page()
+    
     def search_property(self, parcel_number: str) -> Dict[str, str]:
         """
         Step 3: Search for property by parcel number
@@ -573,100 +1368,18 @@ class BrownCountyScraper(BaseScraper):
             Dictionary containing extracted tokens after search
         """
         try:
-            # Prepare form data for POST request
-            form_data = {
-                'ctl00$cphMainApp$ToolkitScriptManager1': 'ctl00$cphMainApp$upSearch|ctl00$cphMainApp$ButtonParcelSearch',
-                'ctl00_cphMainApp_ToolkitScriptManager1_HiddenField': self.tokens.get('ctl00_cphMainApp_ToolkitScriptManager1_HiddenField', ''),
-                '__LASTFOCUS': self.tokens.get('__LASTFOCUS', ''),
-                '__EVENTTARGET': 'cphMainApp$ButtonParcelSearch',
-                '__EVENTARGUMENT': '',
-                '__VIEWSTATE': self.tokens.get('__VIEWSTATE', ''),
-                '__VIEWSTATEGENERATOR': self.tokens.get('__VIEWSTATEGENERATOR', ''),
-                '__SCROLLPOSITIONX': '0',
-                '__SCROLLPOSITIONY': '0',
-                '__VIEWSTATEENCRYPTED': self.tokens.get('__VIEWSTATEENCRYPTED', ''),
-                '__EVENTVALIDATION': self.tokens.get('__EVENTVALIDATION', ''),
-                'ctl00$cphMainApp$pageWidth': '1149',
-                'ctl00$cphMainApp$pageHeight': '1034',
-                'ctl00$cphMainApp$ParcelSearchCriteria1$PropertyType': 'optRealEstate',
-                'ctl00$cphMainApp$ParcelSearchCriteria1$mtxtParcelNumber': parcel_number,
-                'ctl00$cphMainApp$ParcelSearchCriteria1$mtxtAltParcelNumber': '',
-                'ctl00$cphMainApp$ParcelSearchCriteria1$txtLastName': '',
-                'ctl00$cphMainApp$ParcelSearchCriteria1$txtFirstName': '',
-                'ctl00$cphMainApp$ParcelSearchCriteria1$ddlOwnerStatus': 'ALLBUTFORMER',
-                'ctl00$cphMainApp$ParcelSearchCriteria1$txtHouseNumber': '',
-                'ctl00$cphMainApp$ParcelSearchCriteria1$ddlPrefixDir': '',
-                'ctl00$cphMainApp$ParcelSearchCriteria1$txtStreetName': '',
-                'ctl00$cphMainApp$ParcelSearchCriteria1$ddlStreetType': '',
-                'ctl00$cphMainApp$ParcelSearchCriteria1$ddlSuffixDir': '',
-                'ctl00$cphMainApp$ParcelSearchCriteria1$DropDownListPlatType': 'All',
-                'ctl00$cphMainApp$ParcelSearchCriteria1$DropDownListPlatDesc': 'All',
-                'ctl00$cphMainApp$ParcelSearchCriteria1$ddlSection': '',
-                'ctl00$cphMainApp$ParcelSearchCriteria1$ddlTownship': '',
-                'ctl00$cphMainApp$ParcelSearchCriteria1$ddlTownshipDir': '',
-                'ctl00$cphMainApp$ParcelSearchCriteria1$ddlRange': '',
-                'ctl00$cphMainApp$ParcelSearchCriteria1$ddlRangeDir': '',
-                'ctl00$cphMainApp$ParcelSearchCriteria1$ddl40Quarter': '',
-                'ctl00$cphMainApp$ParcelSearchCriteria1$ddl160Quarter': '',
-                'ctl00$cphMainApp$ParcelSearchCriteria1$ddlMunicipality': '',
-                'ctl00$cphMainApp$ParcelSearchCriteria1$cbCurrentProperties': 'on',
-                'ctl00$cphMainApp$ParcelSearchCriteria1$cbHistoricalProperties': 'on',
-                'ctl00$cphMainApp$ButtonParcelSearch': 'Search For Properties'
-            }
+            new_tokens = self._post_search(parcel_number)
             
-            # Set headers for AJAX request
-            headers = {
-                'Content-Type': 'application/x-www-form-urlencoded; charset=UTF-8',
-                'X-MicrosoftAjax': 'Delta=true',
-                'X-Requested-With': 'XMLHttpRequest',
-                'Referer': f'{self.base_url}/',
-                'Origin': self.base_url
-            }
-            
-            # POST request to search
-            url = f"{self.base_url}/Search.aspx"
-            response = self.session.post(url, data=form_data, headers=headers, timeout=30)
-            response.raise_for_status()
-            
-            # Extract new tokens
-            new_tokens = extract_aspnet_tokens(response.text)
-            self.tokens.update(new_tokens)
-            
-            # Use Selenium to fill form and click search button
-            if self.driver:
+            # Fall back to Selenium to fill form and click search button
+            if self._needs_browser(new_tokens):
+                print("Tokens missing from search response, falling back to Selenium...")
                 try:
-                    # Navigate to search page if not already there
-                    if 'Search.aspx' not in self.driver.current_url:
-                        self.driver.get(url)
-                        time.sleep(2)
-                        # Sync cookies after navigation
-                        self._sync_cookies_from_selenium()
-                    
-                    # Fill in parcel number
-                    parcel_input = WebDriverWait(self.driver, self.selenium_timeout).until(
-                        EC.presence_of_element_located((By.ID, "mtxtParcelNumber"))
-                    )
-                    parcel_input.clear()
-                    parcel_input.send_keys(parcel_number)
-                    
-                    # Click search button
-                    search_button = WebDriverWait(self.driver, self.selenium_timeout).until(
-                        EC.element_to_be_clickable((By.ID, "ButtonParcelSearch"))
-                    )
-                    search_button.click()
-                    
-                    # Wait for results to load
-                    time.sleep(3)
-                    
-                    # Extract tokens from the new page
-                    page_source = self.driver.page_source
-                    final_tokens = extract_aspnet_tokens(page_source)
-                    self.tokens.update(final_tokens)
-                    
+                    self._search_selenium(parcel_number)
                     print(f"Successfully searched for parcel {parcel_number}")
-                    
                 except (TimeoutException, NoSuchElementException) as e:
                     print(f"Error in Selenium search interaction: {e}")
+            else:
+                print(f"Successfully searched for parcel {parcel_number}")
             
             return self.tokens
             
@@ -674,65 +1387,67 @@ class BrownCountyScraper(BaseScraper):
             print(f"Error in search_property: {e}")
             return self.tokens
     
-    def get_tax_info(self) -> Dict[str, Any]:
+    def _click_taxes_selenium(self) -> str:
         """
-        Step 4: Click taxes button and get tax information
+        Click the taxes button in the browser (fallback when the direct postback has no tokens)
         
         Returns:
-            Dictionary containing tax information
+            Page source after the taxes view has loaded
         """
+        # The search usually succeeds over HTTP, so the browser may not have run it (or still shows
+        # an earlier parcel); search in the browser first so Taxes opens the right parcel
+        if self._browser_parcel is None or self._browser_parcel != self._parcel_number:
+            print(f"Searching for parcel {self._parcel_number} in the browser first...")
+            self._search_selenium(self._parcel_number)
+        
         try:
-            if not self.driver:
-                self._init_selenium()
-                self.driver.get(f"{self.base_url}/Search.aspx")
-                time.sleep(2)
-                # Sync cookies after navigation
-                self._sync_cookies_from_selenium()
-            
-            # Click taxes button using Selenium
+            # Wait for the element to be present
+            taxes_link = self._wait.until(
+                EC.presence_of_element_located((By.ID, "LinkButtonTaxes"))
+            )
+            
+            # Scroll element into view to avoid click interception
+            # (instant scroll, so there is nothing to wait for before clicking)
+            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", taxes_link)
+            
+            # Try regular click first
+            self._arm_async_postback()
             try:
-                # Wait for the element to be present
-                taxes_link = WebDriverWait(self.driver, self.selenium_timeout).until(
-                    EC.presence_of_element_located((By.ID, "LinkButtonTaxes"))
-                )
-                
-                # Scroll element into view to avoid click interception
-                self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", taxes_link)
-                time.sleep(0.5)  # Wait for scroll to complete
-                
-                # Try regular click first
-                try:
-                    taxes_link.click()
-                except Exception:
-                    # If regular click fails, try JavaScript click
-                    self.driver.execute_script("arguments[0].click();", taxes_link)
-                
-                # Wait for page to update
-                time.sleep(3)  # Increased wait time for page to load
-                
-                # Extract new tokens from updated page
-                page_source = self.driver.page_source
-                new_tokens = extract_aspnet_tokens(page_source)
-                self.tokens.update(new_tokens)
-                
-            except (TimeoutException, NoSuchElementException) as e:
-                print(f"Error clicking taxes button: {e}")
-                # Try alternative: use JavaScript to trigger the postback directly
-                try:
-                    print("Attempting JavaScript postback as fallback...")
-                    self.driver.execute_script(
-                        "WebForm_DoPostBackWithOptions(new WebForm_PostBackOptions("
-                        "'ctl00$cphMainApp$SearchDetailsParcel$LinkButtonTaxes', "
-                        "'', true, '', '', false, true));"
-                    )
-                    time.sleep(3)
-                    page_source = self.driver.page_source
-                    new_tokens = extract_aspnet_tokens(page_source)
-                    self.tokens.update(new_tokens)
-                except Exception as js_error:
-                    print(f"JavaScript fallback also failed: {js_error}")
-                    return {'Error': f'Could not click taxes button: {e}'}
+                taxes_link.click()
+            except Exception:
+                # If regular click fails, try JavaScript click
+                self.driver.execute_script("arguments[0].click();", taxes_link)
             
+        except (TimeoutException, NoSuchElementException) as e:
+            print(f"Error clicking taxes button: {e}")
+            # Try alternative: use JavaScript to trigger the postback directly
+            print("Attempting JavaScript postback as fallback...")
+            self._arm_async_postback()
+            self.driver.execute_script(
+                "WebForm_DoPostBackWithOptions(new WebForm_PostBackOptions("
+                "'ctl00$cphMainApp$SearchDetailsParcel$LinkButtonTaxes', "
+                "'', true, '', '', false, true));"
+            )
+        
+        # Wait for the taxes UpdatePanel (or a full postback) to finish loading
+        self._wait_for_async_postback()
+        
+        # Extract new tokens from updated page
+        return self._extract_tokens_from_page()
+    
+    def get_tax_info(self, structured_only: bool = False) -> Dict[str, Any]:
+        """
+        Step 4: Replay the taxes button postback and get tax information
+        (falls back to clicking the button via Selenium if the response has no tokens)
+        
+        Args:
+            structured_only: Only parse tables, installments, tax history and property details
+                             (see _parse_tax_html)
+        
+        Returns:
+            Dictionary containing tax information
+        """
+        try:
             # Prepare form data for POST request
             form_data = {
                 'ctl00_cphMainApp_ToolkitScriptManager1_HiddenField': self.tokens.get('ctl00_cphMainApp_ToolkitScriptManager1_HiddenField', ''),
@@ -761,14 +1476,21 @@ class BrownCountyScraper(BaseScraper):
             response = self.session.post(url, data=form_data, headers=headers, timeout=30)
             response.raise_for_status()
             
-            # Also get the page source from Selenium after clicking (more reliable)
+            new_tokens = extract_aspnet_tokens(response.text)
+            self.tokens.update(new_tokens)
+            
+            # Only drive the browser when the postback response is unusable
             selenium_html = None
-            if self.driver:
-                time.sleep(2)  # Wait for page to fully load
-                selenium_html = self.driver.page_source
+            if self._needs_browser(new_tokens):
+                print("Tokens missing from taxes response, falling back to Selenium...")
+                try:
+                    selenium_html = self._click_taxes_selenium()
+                except Exception as e:
+                    print(f"Selenium fallback failed: {e}")
+                    return {'Error': f'Could not click taxes button: {e}'}
             
             # Parse tax information from both sources
-            tax_data = self._parse_tax_html(response.text, selenium_html)
+            tax_data = self._parse_tax_html(response.text, selenium_html, structured_only=structured_only)
             
             print("Successfully retrieved tax information")
             return tax_data
@@ -788,48 +1510,59 @@ class BrownCountyScraper(BaseScraper):
         Returns:
             Extracted HTML content
         """
-        # ASP.NET AJAX responses start with pipe-separated metadata
-        if '|updatePanel|' in response_text:
-            parts = response_text.split('|updatePanel|', 1)
-            if len(parts) > 1:
-                # Extract HTML content after the updatePanel marker
-                html_content = parts[1].split('|', 1)[-1] if '|' in parts[1] else parts[1]
-                return html_content
-        return response_text
+        # ASP.NET AJAX responses start with pipe-separated metadata; locate the marker and the
+        # end of the panel id with find() and slice once, instead of splitting copies of the page
+        marker = '|updatePanel|'
+        marker_pos = response_text.find(marker)
+        if marker_pos == -1:
+            return response_text
+        
+        # Extract HTML content after the updatePanel marker and the panel id
+        content_start = marker_pos + len(marker)
+        id_end = response_text.find('|', content_start)
+        return response_text[id_end + 1:] if id_end != -1 else response_text[content_start:]
     
-    def _parse_tax_html(self, response_html: str, selenium_html: Optional[str] = None) -> Dict[str, Any]:
+    def _parse_tax_html(self, response_html: str, selenium_html: Optional[str] = None,
+                        structured_only: bool = False) -> Dict[str, Any]:
         """
         Parse tax information from HTML response
         
         Args:
             response_html: HTML from POST response
             selenium_html: Optional HTML from Selenium page source
+            structured_only: Skip the exploratory sections (tax elements, text patterns, containers,
+                             form inputs) that scrape_parcel does not report
             
         Returns:
             Dictionary containing parsed tax data
         """
         tax_data = {
-            'raw_html': response_html,
             'parsed_data': {}
         }
+        # Raw markup is only kept for debugging; it dominates memory and JSON output size
+        if self.debug:
+            tax_data['raw_html'] = response_html
         
         # Prefer Selenium HTML if available (more complete)
         html_to_parse = selenium_html if selenium_html else response_html
         
-        # Parse ASP.NET AJAX response format if needed
-        if html_to_parse and '|updatePanel|' in html_to_parse:
+        # Parse ASP.NET AJAX response format if needed (plain HTML is returned unchanged)
+        if html_to_parse:
             html_to_parse = self._parse_aspnet_ajax_response(html_to_parse)
         
         if not html_to_parse:
             return tax_data
         
-        soup = BeautifulSoup(html_to_parse, 'html.parser')
+        # One lxml parse of the page; every step below walks this tree
+        root = _parse_html_document(html_to_parse)
+        if root is None:
+            return tax_data
         
         # Look for tax-related content
         # Common patterns: tables, divs with tax info, specific IDs/classes
         
         # 1. Find all tables (tax data is often in tables)
-        tables = soup.find_all('table')
+        tables = list(root.iter('table'))
         tax_data['tables_found'] = len(tables)
         
         # 2. Extract data from tables
@@ -845,93 +1578,100 @@ class BrownCountyScraper(BaseScraper):
                 })
         tax_data['parsed_data']['tables'] = tax_tables_data
         
-        # 3. Look for specific tax-related elements by ID or class
-        tax_elements = {}
-        
-        # Common tax-related IDs/classes to search for
-        tax_selectors = [
-            ('id', ['tax', 'Tax', 'TAX', 'bill', 'Bill', 'BILL']),
-            ('class', ['tax', 'Tax', 'TAX', 'bill', 'Bill', 'BILL', 'amount', 'Amount', 'due', 'Due'])
-        ]
-        
-        for selector_type, keywords in tax_selectors:
-            for keyword in keywords:
-                if selector_type == 'id':
-                    elements = soup.find_all(id=re.compile(keyword, re.I))
-                else:
-                    elements = soup.find_all(class_=re.compile(keyword, re.I))
-                
-                for elem in elements:
-                    elem_id = elem.get('id', '')
-                    elem_class = ' '.join(elem.get('class', []))
-                    key = f"{elem_id}_{elem_class}" if elem_id else elem_class
-                    if key:
-                        tax_elements[key] = {
-                            'tag': elem.name,
-                            'text': elem.get_text(strip=True),
-                            'html': str(elem)[:500]  # First 500 chars
-                        }
-        
-        tax_data['parsed_data']['tax_elements'] = tax_elements
-        
-        # 4. Extract all text content and look for patterns
-        all_text = soup.get_text()
-        
-        # Look for common tax-related patterns
-        patterns = {
-            'amounts': re.findall(r'\$[\d,]+\.?\d*', all_text),
-            'years': re.findall(r'\b(19|20)\d{2}\b', all_text),
-            'parcel_numbers': re.findall(r'\d+[-.]?\d+[-.]?\d+', all_text),
-        }
-        tax_data['parsed_data']['patterns'] = patterns
-        
-        # 5. Look for specific divs or sections that might contain tax info
-        # Common containers: divs with specific IDs, sections, etc.
-        tax_containers = []
-        containers = soup.find_all(['div', 'section'], id=re.compile(r'(tax|bill|payment|assessment)', re.I))
-        for container in containers:
-            container_data = {
-                'id': container.get('id', ''),
-                'class': ' '.join(container.get('class', [])),
-                'text': container.get_text(strip=True)[:500],
-                'children_count': len(container.find_all())
+        # 3-6. Exploratory sections, only needed when the full parse is requested
+        if not structured_only:
+            # 3. Look for specific tax-related elements by ID or class
+            tax_elements = {}
+            for elem in _TAX_ELEMENTS_XPATH(root):
+                elem_id = elem.get('id', '')
+                elem_class = _element_classes(elem)
+                key = f"{elem_id}_{elem_class}" if elem_id else elem_class
+                if key:
+                    tax_elements[key] = {
+                        'tag': elem.tag,
+                        'text': _element_text(elem)
+                    }
+                    if self.debug:
+                        # First 500 chars
+                        tax_elements[key]['html'] = etree.tostring(elem, encoding='unicode', with_tail=False)[:500]
+            
+            tax_data['parsed_data']['tax_elements'] = tax_elements
+            
+            # 4. Extract all text content and look for patterns
+            all_text = ''.join(_iter_visible_text(root))
+            
+            # Look for common tax-related patterns
+            patterns = {
+                'amounts': _AMOUNT_RE.findall(all_text),
+                'years': _YEAR_RE.findall(all_text),
+                'parcel_numbers': _PARCEL_RE.findall(all_text),
             }
-            tax_containers.append(container_data)
-        tax_data['parsed_data']['containers'] = tax_containers
-        
-        # 6. Extract form fields (tax forms often have input fields)
-        form_inputs = []
-        inputs = soup.find_all(['input', 'select', 'textarea'])
-        for inp in inputs:
-            inp_type = inp.get('type', '')
-            inp_name = inp.get('name', '')
-            inp_id = inp.get('id', '')
-            inp_value = inp.get('value', '')
-            
-            # Look for tax-related inputs
-            if any(keyword in (inp_name + inp_id).lower() for keyword in ['tax', 'bill', 'amount', 'due', 'assessment']):
-                form_inputs.append({
-                    'type': inp_type,
-                    'name': inp_name,
-                    'id': inp_id,
-                    'value': inp_value,
-                    'label': self._find_input_label(soup, inp)
-                })
-        tax_data['parsed_data']['form_inputs'] = form_inputs
-        
+            tax_data['parsed_data']['patterns'] = patterns
+            
+            # 5. Look for specific divs or sections that might contain tax info
+            # Common containers: divs with specific IDs, sections, etc.
+            tax_containers = []
+            for container in _TAX_CONTAINERS_XPATH(root):
+                container_data = {
+                    'id': container.get('id', ''),
+                    'class': _element_classes(container),
+                    'text': _element_text(container)[:500],
+                    'children_count': len(container.xpath('.//*'))
+                }
+                tax_containers.append(container_data)
+            tax_data['parsed_data']['containers'] = tax_containers
+            
+            # 6. Extract form fields (tax forms often have input fields)
+            form_inputs = []
+            
+            # Index labels once: by their 'for' attribute (first wins), and the latest label seen
+            # while walking labels and inputs together in document order
+            label_by_for = {}
+            for label in root.iter('label'):
+                if label.get('for'):
+                    label_by_for.setdefault(label.get('for'), label)
+            previous_label = None
+            
+            for inp in root.iter('label', 'input', 'select', 'textarea'):
+                if inp.tag == 'label':
+                    previous_label = inp
+                    continue
+                
+                inp_type = inp.get('type', '')
+                inp_name = inp.get('name', '')
+                inp_id = inp.get('id', '')
+                inp_value = inp.get('value', '')
+                
+                # Look for tax-related inputs
+                if any(keyword in (inp_name + inp_id).lower() for keyword in ['tax', 'bill', 'amount', 'due', 'assessment']):
+                    form_inputs.append({
+                        'type': inp_type,
+                        'name': inp_name,
+                        'id': inp_id,
+                        'value': inp_value,
+                        'label': self._find_input_label(label_by_for, inp, previous_label)
+                    })
+            tax_data['parsed_data']['form_inputs'] = form_inputs
+            
         # 7. Extract Installments and Tax History specifically
-        installments, tax_history = self._extract_installments_and_history(soup, tax_tables_data)
+        installments, tax_history = self._extract_installments_and_history(root, tax_tables_data)
         tax_data['parsed_data']['installments'] = installments
         tax_data['parsed_data']['tax_history'] = tax_history
         
+        # 8. Extract property details from the same parse (tables carry 'headers'/'rows')
+        try:
+            tax_data['parsed_data']['property_details'] = self._extract_property_details(root, tax_tables_data)
+        except Exception as e:
+            print(f"Warning: Could not extract property details: {e}")
+        
         return tax_data
     
-    def _extract_installments_and_history(self, soup: BeautifulSoup, tables_data: List[Dict]) -> tuple:
+    def _extract_installments_and_history(self, root: etree._Element, tables_data: List[Dict]) -> tuple:
         """
         Extract installments and tax history from parsed tables
         
         Args:
-            soup: BeautifulSoup object
+            root: Parsed page (lxml root element)
             tables_data: List of parsed table data
             
         Returns:
@@ -943,54 +1683,47 @@ class BrownCountyScraper(BaseScraper):
         # Look through tables for installments and tax history
         for table_info in tables_data:
             headers = table_info.get('headers', [])
+            if not headers:
+                continue
             rows = table_info.get('rows', [])
             
+            # Column index by header name (first occurrence wins, as with list.index)
+            header_index = {}
+            for i, header in enumerate(headers):
+                header_index.setdefault(header, i)
+            
             # Check for Installments table (headers: ['Due Date', 'Amount'])
-            if len(headers) >= 2 and 'Due Date' in headers and 'Amount' in headers:
-                due_date_idx = headers.index('Due Date')
-                amount_idx = headers.index('Amount')
+            if 'Due Date' in header_index and 'Amount' in header_index:
+                due_date_idx = header_index['Due Date']
+                amount_idx = header_index['Amount']
                 
                 for row in rows:
                     if len(row) > max(due_date_idx, amount_idx):
-                        installment = {
-                            'due_date': row[due_date_idx].strip() if due_date_idx < len(row) else '',
-                            'amount': row[amount_idx].strip() if amount_idx < len(row) else ''
-                        }
+                        due_date = row[due_date_idx].strip()
+                        amount = row[amount_idx].strip()
                         # Only add if we have valid data
-                        if installment['due_date'] and installment['amount']:
-                            installments.append(installment)
+                        if due_date and amount:
+                            installments.append({'due_date': due_date, 'amount': amount})
             
             # Check for Tax History table (headers include 'Year', 'Amount', 'Interest Paid', etc.)
-            if len(headers) >= 7 and 'Year' in headers and 'Amount' in headers:
-                # Look for tax history indicators
-                if any(col in headers for col in ['Interest Paid', 'Penalties Paid', 'Paid', 'Last Paid', 'Amount Due', 'Status']):
-                    year_idx = headers.index('Year')
-                    amount_idx = headers.index('Amount')
-                    
-                    # Find indices for other columns if they exist
-                    interest_paid_idx = headers.index('Interest Paid') if 'Interest Paid' in headers else None
-                    penalties_paid_idx = headers.index('Penalties Paid') if 'Penalties Paid' in headers else None
-                    paid_idx = headers.index('Paid') if 'Paid' in headers else None
-                    last_paid_idx = headers.index('Last Paid') if 'Last Paid' in headers else None
-                    amount_due_idx = headers.index('Amount Due') if 'Amount Due' in headers else None
-                    status_idx = headers.index('Status') if 'Status' in headers else None
-                    
-                    for row in rows:
-                        if len(row) > year_idx:
-                            # Skip header-like rows (check if first cell is a year)
-                            year_value = row[year_idx].strip() if year_idx < len(row) else ''
-                            if year_value and year_value.isdigit() and len(year_value) == 4:
-                                history_entry = {
-                                    'year': year_value,
-                                    'amount': row[amount_idx].strip() if amount_idx and amount_idx < len(row) else '',
-                                    'interest_paid': row[interest_paid_idx].strip() if interest_paid_idx is not None and interest_paid_idx < len(row) else '',
-                                    'penalties_paid': row[penalties_paid_idx].strip() if penalties_paid_idx is not None and penalties_paid_idx < len(row) else '',
-                                    'paid': row[paid_idx].strip() if paid_idx is not None and paid_idx < len(row) else '',
-                                    'last_paid': row[last_paid_idx].strip() if last_paid_idx is not None and last_paid_idx < len(row) else '',
-                                    'amount_due': row[amount_due_idx].strip() if amount_due_idx is not None and amount_due_idx < len(row) else '',
-                                    'status': row[status_idx].strip() if status_idx is not None and status_idx < len(row) else ''
-                                }
-                                tax_history.append(history_entry)
+            if (len(headers) >= 7 and 'Year' in header_index and 'Amount' in header_index
+                    and not _TAX_HISTORY_COLUMNS.isdisjoint(header_index)):
+                year_idx = header_index['Year']
+                # (output key, column index or None) pairs, resolved once per table
+                columns = [(key, header_index.get(header)) for key, header in _TAX_HISTORY_FIELDS.items()]
+                
+                for row in rows:
+                    # Skip header-like rows (check if first cell is a year)
+                    if year_idx >= len(row):
+                        continue
+                    year_value = row[year_idx].strip()
+                    if len(year_value) == 4 and year_value.isdigit():
+                        row_len = len(row)
+                        history_entry = {
+                            key: row[idx].strip() if idx is not None and idx < row_len else ''
+                            for key, idx in columns
+                        }
+                        tax_history.append(history_entry)
         
         return installments, tax_history
     
@@ -999,24 +1732,25 @@ class BrownCountyScraper(BaseScraper):
         Extract structured data from an HTML table
         
         Args:
-            table: BeautifulSoup table element
+            table: lxml table element
             
         Returns:
             Dictionary with headers and rows, or None if table is empty
         """
-        headers = []
-        rows = []
+        # Every row in the table (nested tables included), in document order
+        table_rows = list(table.iter('tr'))
+        if not table_rows:
+            return None
         
-        # Find header row (th elements)
-        header_row = table.find('tr')
-        if header_row:
-            headers = [th.get_text(strip=True) for th in header_row.find_all(['th', 'td'])]
+        # First row holds the headers (th or td cells)
+        headers = [_element_text(cell) for cell in table_rows[0].iter('th', 'td')]
         
-        # Find all data rows
-        data_rows = table.find_all('tr')[1:] if headers else table.find_all('tr')
+        # Remaining rows (all rows if the first one has no cells)
+        data_rows = table_rows[1:] if headers else table_rows
         
+        rows = []
         for row in data_rows:
-            cells = [td.get_text(strip=True) for td in row.find_all(['td', 'th'])]
+            cells = [_element_text(cell) for cell in row.iter('td', 'th')]
             if cells:
                 rows.append(cells)
         
@@ -1029,42 +1763,39 @@ class BrownCountyScraper(BaseScraper):
             'row_count': len(rows)
         }
     
-    def _find_input_label(self, soup, input_elem) -> str:
+    def _find_input_label(self, label_by_for: Dict[str, Any], input_elem, previous_label=None) -> str:
         """
         Find the label associated with an input element
         
         Args:
-            soup: BeautifulSoup object
+            label_by_for: Label elements indexed by their 'for' attribute
             input_elem: Input element
+            previous_label: Nearest label before the input in document order, if any
             
         Returns:
             Label text or empty string
         """
         # Try to find label by 'for' attribute matching input id
         inp_id = input_elem.get('id', '')
-        if inp_id:
-            label = soup.find('label', {'for': inp_id})
-            if label:
-                return label.get_text(strip=True)
+        if inp_id and inp_id in label_by_for:
+            return _element_text(label_by_for[inp_id])
         
         # Try to find parent label
-        parent = input_elem.find_parent('label')
-        if parent:
-            return parent.get_text(strip=True)
+        for parent in input_elem.iterancestors('label'):
+            return _element_text(parent)
         
-        # Try to find preceding label
-        prev = input_elem.find_previous('label')
-        if prev:
-            return prev.get_text(strip=True)
+        # Fall back to the preceding label
+        if previous_label is not None:
+            return _element_text(previous_label)
         
         return ''
     
-    def _extract_property_details(self, soup: BeautifulSoup, tables_data: List[Dict]) -> Dict[str, Any]:
+    def _extract_property_details(self, root: etree._Element, tables_data: List[Dict]) -> Dict[str, Any]:
         """
         Extract property details from parsed tables
         
         Args:
-            soup: BeautifulSoup object
+            root: Parsed page (lxml root element)
             tables_data: List of parsed table data
             
         Returns:
@@ -1072,46 +1803,35 @@ class BrownCountyScraper(BaseScraper):
         """
         property_details = {}
         
-        # Look for property information table (usually first table with property info)
+        # Look for property information table (the first table with property info)
         for table_info in tables_data:
             headers = table_info.get('headers', [])
             rows = table_info.get('rows', [])
             
             # Check for property info table (headers like 'Tax Year', 'Parcel Number', 'Property Address', etc.)
-            if len(headers) >= 3 and any(col in headers for col in ['Parcel Number', 'Property Address', 'Municipality', 'Owner']):
-                if rows and len(rows) > 0:
-                    row = rows[0]  # Get first row
-                    
-                    # Map headers to values
-                    for i, header in enumerate(headers):
-                        if i < len(row):
-                            value = row[i].strip()
-                            if value:
-                                # Normalize header names
-                                header_lower = header.lower()
-                                if 'parcel' in header_lower and 'number' in header_lower:
-                                    property_details['parcel_number'] = value
-                                elif 'property' in header_lower and 'address' in header_lower:
-                                    property_details['property_address'] = value
-                                elif 'billing' in header_lower and 'address' in header_lower:
-                                    property_details['billing_address'] = value
-                                elif 'municipality' in header_lower:
-                                    property_details['municipality'] = value
-                                elif 'owner' in header_lower:
-                                    property_details['owner'] = value
-                                elif 'tax' in header_lower and 'year' in header_lower:
-                                    property_details['tax_year'] = value
-                                elif 'prop' in header_lower and 'type' in header_lower:
-                                    property_details['property_type'] = value
+            if len(headers) < 3 or not rows or _PROPERTY_TABLE_HEADERS.isdisjoint(headers):
+                continue
+            
+            row = rows[0]  # Get first row
+            
+            # Map headers to values
+            for header, value in zip(headers, row):
+                key = _property_detail_key(header)
+                value = value.strip()
+                if key and value:
+                    property_details[key] = value
+            
+            if property_details:
+                break
         
         # Also try to extract from specific elements
-        bill_number_elem = soup.find(id='lblBillNumber')
-        if bill_number_elem:
-            property_details['bill_number'] = bill_number_elem.get_text(strip=True)
+        bill_number_elems = root.xpath("//*[@id='lblBillNumber']")
+        if bill_number_elems:
+            property_details['bill_number'] = _element_text(bill_number_elems[0])
         
-        net_mill_rate_elem = soup.find(id='lblNetMillRate')
-        if net_mill_rate_elem:
-            property_details['net_mill_rate'] = net_mill_rate_elem.get_text(strip=True)
+        net_mill_rate_elems = root.xpath("//*[@id='lblNetMillRate']")
+        if net_mill_rate_elems:
+            property_details['net_mill_rate'] = _element_text(net_mill_rate_elems[0])
         
         return property_details
     
@@ -1128,49 +1848,35 @@ class BrownCountyScraper(BaseScraper):
         try:
             result = {'ParcelNumber': parcel_number}
             
-            # Step 1: Get cookie and extract tokens
-            print(f"Step 1: Getting cookies for parcel {parcel_number}...")
-            tokens = self.get_cookie()
-            if not tokens:
-                return {'ParcelNumber': parcel_number, 'Error': 'Failed to get initial cookies'}
-            
-            # Step 2: Accept terms
-            print(f"Step 2: Accepting terms for parcel {parcel_number}...")
-            tokens = self.accept_terms()
-            
-            # Step 3: Search property
-            print(f"Step 3: Searching for parcel {parcel_number}...")
-            tokens = self.search_property(parcel_number)
+            # Steps 1-2 only run when there is no fresh saved session to search with
+            if not self._search_with_saved_session(parcel_number):
+                # Step 1: Get cookie and extract tokens
+                print(f"Step 1: Getting cookies for parcel {parcel_number}...")
+                tokens = self.get_cookie()
+                if not tokens:
+                    return {'ParcelNumber': parcel_number, 'Error': 'Failed to get initial cookies'}
+                
+                # Step 2: Accept terms
+                print(f"Step 2: Accepting terms for parcel {parcel_number}...")
+                tokens = self.accept_terms()
+                self._save_session_state()
+                
+                # Step 3: Search property
+                print(f"Step 3: Searching for parcel {parcel_number}...")
+                tokens = self.search_property(parcel_number)
             
             # Step 4: Get tax info
             print(f"Step 4: Getting tax information for parcel {parcel_number}...")
-            tax_data = self.get_tax_info()
+            # Only the structured sections end up in the result
+            tax_data = self.get_tax_info(structured_only=True)
             
             # Extract only essential data
             if 'Error' not in tax_data:
                 parsed_data = tax_data.get('parsed_data', {})
                 
-                # Get property details
-                if self.driver:
-                    try:
-                        page_source = self.driver.page_source
-                        soup = BeautifulSoup(page_source, 'html.parser')
-                        # Parse ASP.NET AJAX if needed
-                        if '|updatePanel|' in page_source:
-                            page_source = self._parse_aspnet_ajax_response(page_source)
-                            soup = BeautifulSoup(page_source, 'html.parser')
-                        
-                        tables = soup.find_all('table')
-                        tables_data = []
-                        for table in tables:
-                            table_data = self._extract_table_data(table)
-                            if table_data:
-                                tables_data.append(table_data)
-                        
-                        property_details = self._extract_property_details(soup, tables_data)
-                        result['PropertyDetails'] = property_details
-                    except Exception as e:
-                        print(f"Warning: Could not extract property details: {e}")
+                # Property details come from the same parse of the taxes page (browser or postback)
+                if 'property_details' in parsed_data:
+                    result['PropertyDetails'] = parsed_data['property_details']
                 
                 # Extract only installments and tax history
                 result['Installments'] = parsed_data.get('installments', [])
@@ -1193,22 +1899,67 @@ class BrownCountyScraper(BaseScraper):
         Returns:
             List of dictionaries containing scraped data
         """
+        if self.max_workers > 1 and len(parcel_numbers) > 1:
+            return self._scrape_parallel(parcel_numbers)
+        
         results = []
-        try:
+        # One Selenium driver (if any step needs it) is shared by all parcels; it is closed here
+        # unless the caller holds the scraper open with its own `with` block
+        with self:
             for parcel_number in parcel_numbers:
                 print(f"\n{'='*60}")
                 print(f"Scraping parcel: {parcel_number}")
                 print(f"{'='*60}")
+                self.rate_limiter.wait()  # Be respectful with rate limiting
                 result = self.scrape_parcel(parcel_number)
                 results.append(result)
-                time.sleep(2)  # Be respectful with rate limiting
-        finally:
-            # Always close Selenium driver
-            self._close_selenium()
         
         return results
     
-    def __del__(self):
-        """Cleanup: close Selenium driver"""
-        self._close_selenium()
+    def _scrape_parallel(self, parcel_numbers: List[str]) -> List[Dict[str, Any]]:
+        """
+        Scrape parcels concurrently with a pool of independent worker scrapers
+        
+        WebForms tokens and cookies are per-session state, so each worker owns its own
+        scraper instance (and browser, if one is needed) and reuses it for every parcel it takes.
+        The pool outlives this call while the scraper is held open with `with`. Workers never use
+        the token cache file: shared cookies would put them all on one server session, and one
+        worker discarding the file would pull it out from under the others.
+        
+        Args:
+            parcel_numbers: List of parcel numbers to scrape
+            
+        Returns:
+            List of dictionaries containing scraped data, in input order
+        """
+        while len(self._workers) < min(self.max_workers, len(parcel_numbers)):
+            self._workers.append(
+                type(self)(self.base_url, headless=self.headless, selenium_timeout=self.selenium_timeout,
+                           debug=self.debug, token_cache_path=None,
+                           token_cache_ttl=self.token_cache_ttl)
+            )
+        workers = self._workers
+        idle_workers = queue.Queue()
+        for worker in workers:
+            idle_workers.put(worker)
+        
+        def scrape_one(parcel_number: str) -> Dict[str, Any]:
+            worker = idle_workers.get()
+            try:
+                # Workers share this scraper's limiter so the host sees one combined rate
+                self.rate_limiter.wait()
+                print(f"Scraping parcel: {parcel_number}")
+                return worker.scrape_parcel(parcel_number)
+            finally:
+                idle_workers.put(worker)
+        
+        with self:
+            with ThreadPoolExecutor(max_workers=len(workers)) as executor:
+                return list(executor.map(scrape_one, parcel_numbers))
+    
+    def _close_workers(self):
+        """Close the parallel worker scrapers (and their browsers)"""
+        workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.__exit__(None, None, None)
 
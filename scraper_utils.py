@@ -0,0 +1,158 @@
+"""
+Shared helpers for the county scrapers and the data normalizer
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+from datetime import date, datetime
+from decimal import Decimal
+import hashlib
+import json
+import os
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # Optional: JSON output then falls back to the stdlib encoder
+    orjson = None
+
+
+def mount_pooled_adapter(session: requests.Session) -> requests.Session:
+    """
+    Give a session pooled keep-alive connections, reused across every parcel request,
+    with retries on gateway errors
+    
+    Args:
+        session: Session to configure (plain or caching)
+        
+    Returns:
+        The same session
+    """
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504))
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+# JSON encoding of the few non-JSON values a result may carry, dispatched on exact type;
+# anything else is written as its string form
+_JSON_CONVERTERS = {
+    datetime: datetime.isoformat,
+    date: date.isoformat,
+    Decimal: float,
+}
+
+
+def json_default(value: Any) -> Any:
+    """`default` hook for the JSON encoders"""
+    convert = _JSON_CONVERTERS.get(type(value))
+    return convert(value) if convert is not None else str(value)
+
+
+@contextmanager
+def atomic_output(filename: str) -> Iterator[str]:
+    """
+    Write an output file atomically: yield a temporary path next to filename and move the
+    finished file into place, so an interrupted run never leaves a truncated file behind
+    
+    Args:
+        filename: Final output path
+        
+    Yields:
+        Temporary path to write to (removed again if writing fails)
+    """
+    tmp_filename = f"{filename}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        yield tmp_filename
+    except BaseException:
+        if os.path.exists(tmp_filename):
+            os.remove(tmp_filename)
+        raise
+    os.replace(tmp_filename, filename)
+
+
+def dump_json(data: Any, pretty: bool = False) -> bytes:
+    """
+    Serialize data to JSON bytes, with orjson when it is installed
+    
+    Args:
+        data: JSON-serializable data (non-JSON values go through json_default)
+        pretty: Indent the output for reading; compact output is smaller and faster to write
+        
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        # Native encoder: several times faster than json.dumps on large nested results
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(data, default=json_default, option=option)
+    if pretty:
+        return json.dumps(data, indent=2, default=json_default).encode()
+    return json.dumps(data, separators=(',', ':'), default=json_default).encode()
+
+
+def write_bytes(payload: bytes, filename: str):
+    """Write bytes to a file atomically"""
+    with atomic_output(filename) as tmp_filename:
+        with open(tmp_filename, 'wb') as f:
+            f.write(payload)
+
+
+def write_json(data: Any, filename: str, pretty: bool = False):
+    """
+    Write data to a JSON file atomically (see dump_json)
+    
+    Args:
+        data: JSON-serializable data
+        filename: Output JSON path
+        pretty: Indent the output for reading
+    """
+    write_bytes(dump_json(data, pretty), filename)
+
+
+def write_outputs(payload: bytes, json_path: Path, hash_path: Path,
+                  plan_writes: Callable[[], Dict[Path, Callable[[], Any]]]) -> Tuple[bool, List[Path]]:
+    """
+    Write raw JSON and the files derived from it concurrently, unless the outputs of an
+    earlier run with the same payload are all still on disk
+    
+    The sidecar at hash_path holds the payload's blake2b digest followed by every output path,
+    one per line; it is replaced only after all of the outputs are complete.
+    
+    Args:
+        payload: Serialized raw results (see dump_json); hashed in memory, then written to json_path
+        json_path: Raw JSON output path
+        hash_path: Sidecar recording the last complete set of outputs
+        plan_writes: Called only when the outputs are stale, while the JSON is being written;
+                     returns a mapping of output path to a zero-argument function that writes it
+        
+    Returns:
+        Whether the outputs were written (False if they were up to date), and every output path
+    """
+    digest = hashlib.blake2b(payload).hexdigest()
+    if hash_path.exists():
+        recorded_digest, *recorded_paths = hash_path.read_text().splitlines() or ['']
+        output_paths = [Path(path) for path in recorded_paths]
+        if recorded_digest == digest and all(path.exists() for path in output_paths):
+            return False, output_paths
+    
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(write_bytes, payload, json_path)]
+        writes = plan_writes()
+        futures.extend(executor.submit(write) for write in writes.values())
+    for future in futures:
+        future.result()
+    
+    output_paths = [json_path, *writes]
+    with atomic_output(hash_path) as tmp_hash_path:
+        Path(tmp_hash_path).write_text('\n'.join([digest, *map(str, output_paths)]))
+    return True, output_paths
@@ -10,7 +10,9 @@ from brown_county_config import (
     OUTPUT_JSON_FILE,
     SCRAPER_BASE_URL,
     SCRAPER_HEADLESS,
-    SCRAPER_SELENIUM_TIMEOUT
+    SCRAPER_SELENIUM_TIMEOUT,
+    SCRAPER_MAX_WORKERS,
+    SCRAPER_PARCELS_PER_SECOND
 )
 from brown_county_test_helpers import (
     print_test_info,
@@ -22,13 +24,6 @@ from brown_county_test_helpers import (
 
 
 def main():
-    # Initialize scraper
-    scraper = BrownCountyScraper(
-        base_url=SCRAPER_BASE_URL,
-        headless=SCRAPER_HEADLESS,
-        selenium_timeout=SCRAPER_SELENIUM_TIMEOUT
-    )
-    
     # Display test information
     print_test_info(TEST_PARCEL_NUMBERS)
     
@@ -37,7 +32,15 @@ def main():
     print("Starting scraping...")
     print("=" * 60 + "\n")
     
-    results = scraper.scrape(TEST_PARCEL_NUMBERS)
+    # The with block owns the browser: further scrape() calls inside it reuse the same driver
+    with BrownCountyScraper(
+        base_url=SCRAPER_BASE_URL,
+        headless=SCRAPER_HEADLESS,
+        selenium_timeout=SCRAPER_SELENIUM_TIMEOUT,
+        max_workers=SCRAPER_MAX_WORKERS,
+        parcels_per_second=SCRAPER_PARCELS_PER_SECOND
+    ) as scraper:
+        results = scraper.scrape(TEST_PARCEL_NUMBERS)
     
     if results:
         # Save results to files
@@ -0,0 +1,28 @@
+"""
+Tests for TaxDataNormalizer file output
+"""
+
+import openpyxl
+import pandas as pd
+
+from data_normalizer import TaxDataNormalizer
+
+
+def test_save_to_excel_sheets_writes_nested_values_as_strings(tmp_path):
+    df = pd.DataFrame({
+        'parcel_id': ['A', 'B'],
+        'amounts': [[1, 2], None],
+        'details': [{'year': 2024}, 'none'],
+        'due_date': pd.to_datetime(['2024-01-31', None]),
+    })
+    filename = tmp_path / 'tables.xlsx'
+    
+    TaxDataNormalizer().save_to_excel_sheets({'properties': df}, filename)
+    
+    # Same cell values as DataFrame.to_excel
+    expected_filename = tmp_path / 'expected.xlsx'
+    df.to_excel(expected_filename, sheet_name='properties', index=False)
+    rows = [[cell.value for cell in row] for row in openpyxl.load_workbook(filename)['properties'].iter_rows()]
+    expected_rows = [[cell.value for cell in row] for row in openpyxl.load_workbook(expected_filename)['properties'].iter_rows()]
+    assert rows == expected_rows
+    assert rows[1][1:3] == ['[1, 2]', "{'year': 2024}"]
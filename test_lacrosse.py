@@ -3,7 +3,6 @@ Test script for La Crosse County Scraper
 """
 
 from lacrosse_scraper import LaCrosseScraper
-import json
 
 def main():
     # Initialize scraper
@@ -42,8 +41,7 @@ def main():
             
             # Save raw JSON for debugging
             json_filename = "lacrosse_parcels_test.json"
-            with open(json_filename, 'w') as f:
-                json.dump(results, f, indent=2, default=str)
+            scraper.save_to_json(results, json_filename)
             print(f"✓ Raw data saved to {json_filename}")
             
             print("\n" + "=" * 60)
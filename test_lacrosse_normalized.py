@@ -4,10 +4,28 @@ Test script for La Crosse County Scraper with Data Normalization
 
 from lacrosse_scraper import LaCrosseScraper
 from data_normalizer import TaxDataNormalizer
-import json
+from scraper_utils import dump_json, write_outputs
+from functools import partial
+from pathlib import Path
+import logging
 import os
+import sys
 
-def main():
+logger = logging.getLogger(__name__)
+
+SEP = "=" * 60
+
+
+def banner(message: str, before: str = "", after: str = ""):
+    """Log a message between two separator lines as a single record"""
+    logger.info("%s%s\n%s\n%s%s", before, SEP, message, SEP, after)
+
+
+def main(pretty_json: bool = False):
+    # Script output goes through logging (message only, on stdout); basicConfig does nothing if the
+    # caller already configured logging, so importing and calling main() keeps the caller's handlers
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
+    
     # Initialize scraper
     scraper = LaCrosseScraper()
     
@@ -18,75 +36,72 @@ def main():
         # Add more parcel IDs as needed
     ]
     
-    print("=" * 60)
-    print("Testing La Crosse County Scraper with Normalization")
-    print("=" * 60)
-    print(f"\nTesting with {len(parcel_ids)} parcel ID(s):")
+    banner("Testing La Crosse County Scraper with Normalization")
+    logger.info("\nTesting with %d parcel ID(s):", len(parcel_ids))
     for i, pid in enumerate(parcel_ids, 1):
-        print(f"  {i}. {pid}")
+        logger.info("  %d. %s", i, pid)
     
     # Scrape parcels
-    print("\n" + "=" * 60)
-    print("Starting scraping workflow...")
-    print("=" * 60 + "\n")
+    banner("Starting scraping workflow...", before="\n", after="\n")
     
     try:
         results = scraper.scrape(parcel_ids, tax_year="2025")
         
         if results:
-            # Save raw JSON for debugging
-            json_filename = "lacrosse_parcels_raw.json"
-            with open(json_filename, 'w') as f:
-                json.dump(results, f, indent=2, default=str)
-            print(f"\n✓ Raw data saved to {json_filename}")
-            
-            # Normalize data
-            print("\n" + "=" * 60)
-            print("Normalizing data into structured format...")
-            print("=" * 60 + "\n")
+            # Raw JSON for debugging, normalized data as separate CSV files, and all tables in one Excel file
+            json_path = Path("lacrosse_parcels_raw.json")
+            base_filename = "lacrosse_normalized"
+            excel_path = Path(f"{base_filename}_all_tables.xlsx")
+            # Digest of the raw JSON from the run that produced the current normalized files
+            hash_path = Path(f"{base_filename}.hash")
             
             normalizer = TaxDataNormalizer()
-            normalized_data = normalizer.normalize_scraped_data(results)
+            normalized_data = {}
             
-            # Save normalized data to separate CSV files
-            base_filename = "lacrosse_normalized"
-            normalizer.save_to_csv_files(normalized_data, base_filename)
+            def plan_writes():
+                # Only runs when the results changed, overlapping normalization with the JSON write
+                banner("Normalizing data into structured format...", before="\n", after="\n")
+                normalized_data.update(normalizer.normalize_scraped_data(results))
+                # One CSV per table plus the xlsx, all written concurrently (the xlsx is the slowest)
+                writes = {
+                    Path(f"{base_filename}_{table_name}.csv"):
+                        partial(normalizer.save_to_csv_files, {table_name: df}, base_filename)
+                    for table_name, df in normalized_data.items()
+                }
+                writes[excel_path] = partial(normalizer.save_to_excel_sheets, normalized_data, excel_path)
+                return writes
             
-            # Also save to Excel with multiple sheets
-            excel_filename = f"{base_filename}_all_tables.xlsx"
-            normalizer.save_to_excel_sheets(normalized_data, excel_filename)
+            payload = dump_json(results, pretty_json)
+            written, output_paths = write_outputs(payload, json_path, hash_path, plan_writes)
+            if written:
+                logger.info("\n✓ Raw data saved to %s", json_path)
+            else:
+                logger.info("Output files are up to date with these results, skipping normalization")
             
-            print("\n" + "=" * 60)
-            print(f"SUCCESS: Processed {len(results)} parcel record(s)")
-            print("=" * 60)
+            banner(f"SUCCESS: Processed {len(results)} parcel record(s)", before="\n")
             
-            # Print summary
-            print("\nData Summary:")
-            print("-" * 60)
-            print(f"Properties: {len(normalized_data['properties'])}")
-            print(f"Tax Periods: {len(normalized_data['tax_periods'])}")
-            print(f"Installments: {len(normalized_data['installments'])}")
-            print(f"Delinquent Taxes: {len(normalized_data['delinquent_taxes'])}")
-            print(f"Penalties/Interest: {len(normalized_data['penalties_interest'])}")
+            # Print summary: one pass over the normalized tables gives each row count and CSV file,
+            # so tables added to the normalizer show up without changes here
+            if normalized_data:
+                logger.info("\nData Summary:")
+                logger.info("-" * 60)
+                for table_name, df in normalized_data.items():
+                    logger.info("%s: %d (%s_%s.csv)", table_name.replace('_', ' ').title(), len(df), base_filename, table_name)
             
-            print("\n" + "=" * 60)
-            print("Files created:")
-            print(f"  - {json_filename} (raw data)")
-            for table_name in normalized_data.keys():
-                print(f"  - {base_filename}_{table_name}.csv")
-            print(f"  - {excel_filename} (all tables)")
-            print("=" * 60)
+            notes = {json_path: " (raw data)", excel_path: " (all tables)"}
+            logger.info("\n" + SEP)
+            logger.info("Files created:")
+            for output_path in output_paths:
+                logger.info("  - %s%s", output_path, notes.get(output_path, ''))
+            logger.info(SEP)
         else:
-            print("\n" + "=" * 60)
-            print("WARNING: No results found")
-            print("=" * 60)
+            banner("WARNING: No results found", before="\n")
             
     except Exception as e:
-        print("\n" + "=" * 60)
-        print(f"ERROR: {e}")
-        print("=" * 60)
-        import traceback
-        traceback.print_exc()
+        logger.info("\n" + SEP)
+        logger.exception("ERROR: %s", e)
+        logger.info(SEP)
 
 if __name__ == "__main__":
-    main()
+    # --pretty indents the raw JSON dump for reading by hand
+    main(pretty_json='--pretty' in sys.argv[1:])
@@ -3,14 +3,52 @@ Test script for Website 1 Scraper with specific parcel numbers
 """
 
 from scraper import Website1Scraper
-import json
+from scraper_utils import dump_json, write_outputs
+from functools import partial
+from pathlib import Path
+import sys
 
-def main():
-    # Initialize scraper
-    # If login is required, provide credentials:
-    # scraper = Website1Scraper(username="your_username", password="your_password")
-    scraper = Website1Scraper()
+SEP = "=" * 60
+
+
+def banner(message: str, before: str = "", after: str = ""):
+    """Print a message between two separator lines with a single write"""
+    print(f"{before}{SEP}\n{message}\n{SEP}{after}")
+
+
+# Tax bill summary line by the exact type of the tax data
+_TAX_DATA_SUMMARIES = {
+    list: lambda tax_data: f"   Number of Tax Bills: {len(tax_data)}",
+    dict: lambda tax_data: f"   Tax Bill Keys: {list(tax_data.keys())[:5]}...",
+}
+
+
+def summarize_result(index: int, result) -> str:
+    """Preformatted multi-line summary of one ParcelResult"""
+    lines = [f"\n{index}. Parcel Number: {result.parcel_number}"]
+    
+    # Search data summary
+    if result.search_data:
+        first_result = result.search_data[0]
+        lines.append(f"   Parcel ID: {first_result.get('ParcelId', 'N/A')}")
+        lines.append(f"   Owner: {first_result.get('OwnerName', 'N/A')}")
+        lines.append(f"   District: {first_result.get('DistrictName', 'N/A')}")
     
+    # Tax bill data summary
+    tax_data = result.tax_data
+    if tax_data:
+        lines.append("   Tax Bill Data Available: Yes")
+        describe = _TAX_DATA_SUMMARIES.get(type(tax_data))
+        if describe is not None:
+            lines.append(describe(tax_data))
+    
+    # Error if present
+    if result.error:
+        lines.append(f"   Error: {result.error}")
+    return '\n'.join(lines)
+
+
+def main(pretty_json: bool = False):
     # Test parcel numbers
     parcel_numbers = [
         "6000350000",
@@ -21,75 +59,65 @@ def main():
         "6000400000"
     ]
     
-    print("=" * 60)
-    print("Testing Website 1 Scraper")
-    print("=" * 60)
+    # Parcel numbers that differ only by leading zeros are the same parcel; scrape each one once
+    unique_parcels = {}
+    for pn in parcel_numbers:
+        key = pn.lstrip('0') or '0'
+        if key in unique_parcels:
+            print(f"Skipping {pn}: same parcel as {unique_parcels[key]}")
+        else:
+            unique_parcels[key] = pn
+    parcel_numbers = list(unique_parcels.values())
+    
+    # Initialize scraper
+    # Parcels are network-bound, so scrape them all concurrently (up to 8 worker threads)
+    # If login is required, provide credentials:
+    # scraper = Website1Scraper(username="your_username", password="your_password")
+    scraper = Website1Scraper(max_workers=min(8, len(parcel_numbers)))
+    
+    banner("Testing Website 1 Scraper")
     print(f"\nTesting with {len(parcel_numbers)} parcel numbers:")
     for i, pn in enumerate(parcel_numbers, 1):
         print(f"  {i}. {pn}")
     
     # Scrape parcels
-    print("\n" + "=" * 60)
-    print("Starting scraping...")
-    print("=" * 60 + "\n")
+    banner("Starting scraping...", before="\n", after="\n")
     
     results = scraper.scrape(parcel_numbers)
     
     if results:
-        # Save to CSV
-        csv_filename = "greenlake_parcels_test.csv"
-        scraper.save_to_csv(results, csv_filename)
-        
-        # Save to Excel
-        excel_filename = "greenlake_parcels_test.xlsx"
-        scraper.save_to_excel(results, excel_filename)
+        csv_path = Path("greenlake_parcels_test.csv")
+        excel_path = Path("greenlake_parcels_test.xlsx")
+        # Raw JSON for debugging; its digest tells whether the results changed since the last run
+        json_path = Path("greenlake_parcels_test.json")
+        hash_path = Path("greenlake_parcels_test.hash")
         
-        # Save raw JSON for debugging
-        json_filename = "greenlake_parcels_test.json"
-        with open(json_filename, 'w') as f:
-            json.dump(results, f, indent=2, default=str)
-        print(f"Raw data saved to {json_filename}")
+        # JSON, CSV and xlsx are written concurrently, or skipped if unchanged since the last run
+        payload = dump_json([result.to_dict() for result in results], pretty_json)
+        written, _ = write_outputs(payload, json_path, hash_path, lambda: {
+            csv_path: partial(scraper.save_to_csv, results, csv_path),
+            excel_path: partial(scraper.save_to_excel, results, excel_path),
+        })
+        if written:
+            print(f"Raw data saved to {json_path}")
+        else:
+            print("Output files are up to date with these results, skipping")
         
-        print("\n" + "=" * 60)
-        print(f"SUCCESS: Scraped {len(results)} parcel record(s)")
-        print("=" * 60)
+        banner(f"SUCCESS: Scraped {len(results)} parcel record(s)", before="\n")
         
         print("\nDetailed Results:")
         print("-" * 60)
-        for i, result in enumerate(results, 1):
-            print(f"\n{i}. Parcel Number: {result.get('ParcelNumber')}")
-            
-            # Show search data summary
-            search_data = result.get('SearchData', [])
-            if search_data and len(search_data) > 0:
-                first_result = search_data[0]
-                print(f"   Parcel ID: {first_result.get('ParcelId', 'N/A')}")
-                print(f"   Owner: {first_result.get('OwnerName', 'N/A')}")
-                print(f"   District: {first_result.get('DistrictName', 'N/A')}")
-            
-            # Show tax bill data summary
-            tax_data = result.get('TaxBillData', {})
-            if tax_data:
-                print(f"   Tax Bill Data Available: Yes")
-                if isinstance(tax_data, list) and len(tax_data) > 0:
-                    print(f"   Number of Tax Bills: {len(tax_data)}")
-                elif isinstance(tax_data, dict):
-                    print(f"   Tax Bill Keys: {list(tax_data.keys())[:5]}...")
-            
-            # Show error if present
-            if 'Error' in result:
-                print(f"   Error: {result.get('Error')}")
+        # All summaries are built first and written with one print
+        print('\n'.join(summarize_result(i, result) for i, result in enumerate(results, 1)))
         
-        print("\n" + "=" * 60)
+        print("\n" + SEP)
         print(f"Files saved:")
-        print(f"  - {csv_filename}")
-        print(f"  - {excel_filename}")
-        print(f"  - {json_filename}")
-        print("=" * 60)
+        print(f"  - {csv_path}")
+        print(f"  - {excel_path}")
+        print(f"  - {json_path}")
+        print(SEP)
     else:
-        print("\n" + "=" * 60)
-        print("WARNING: No results found for any parcel numbers")
-        print("=" * 60)
+        banner("WARNING: No results found for any parcel numbers", before="\n")
         print("\nPossible reasons:")
         print("  1. Parcel numbers may not exist in the database")
         print("  2. Login may be required (provide credentials)")
@@ -97,5 +125,6 @@ def main():
         print("  4. Network/connection issues")
 
 if __name__ == "__main__":
-    main()
+    # --pretty indents the raw JSON dump for reading by hand
+    main(pretty_json='--pretty' in sys.argv[1:])
 